@@ -4,6 +4,7 @@ Compatible with Python 3.13 and SQLAlchemy 2.x
 """
 
 import logging
+from dataclasses import dataclass
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 
@@ -15,6 +16,13 @@ import pymysql
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class Chunk:
+    """A searchable piece of page content, tagged with what the chunker made it from"""
+    text: str
+    kind: str  # 'content', 'company', 'people' or 'timeline'
+
+
 class DatabaseManager:
     """Database manager for handling all database operations"""
     
@@ -149,7 +157,7 @@ class DatabaseManager:
                 content_chunks = self._split_content_into_chunks(content)
                 for i, chunk in enumerate(content_chunks):
                     chunks.append({
-                        "chunk_text": chunk,
+                        "chunk_text": chunk.text,
                         "chunk_type": "content",
                         "priority": 5,
                         "chunk_order": i
@@ -175,7 +183,7 @@ class DatabaseManager:
         except SQLAlchemyError as e:
             logger.error(f"Error creating content chunks: {e}")
     
-    def _split_content_into_chunks(self, content: str, max_chunk_size: int = 300) -> List[str]:
+    def _split_content_into_chunks(self, content: str, max_chunk_size: int = 300) -> List[Chunk]:
         """Split content into meaningful, searchable chunks"""
         if not content:
             return []
@@ -207,17 +215,17 @@ class DatabaseManager:
                         
                     # If adding this sentence exceeds max size, save current chunk
                     if len(current_chunk + " " + sentence) > max_chunk_size and current_chunk:
-                        chunks.append(current_chunk.strip())
+                        chunks.append(Chunk(current_chunk.strip(), 'content'))
                         current_chunk = sentence
                     else:
                         current_chunk += " " + sentence if current_chunk else sentence
                 
                 # Add remaining chunk
                 if current_chunk.strip():
-                    chunks.append(current_chunk.strip())
+                    chunks.append(Chunk(current_chunk.strip(), 'content'))
             else:
                 # Section is small enough, add as is
-                chunks.append(section)
+                chunks.append(Chunk(section, 'content'))
         
         # Method 2: Extract specific patterns as separate chunks
         # Extract company names, people names, years, etc.
@@ -270,12 +278,12 @@ class DatabaseManager:
                 # Create comprehensive company chunk
                 unique_companies = list(set(filtered_companies))
                 company_chunk = "Companies: " + ", ".join(unique_companies[:10])  # Limit to top 10
-                chunks.append(company_chunk)
+                chunks.append(Chunk(company_chunk, 'company'))
                 
                 # Also create individual company chunks for better search
                 for company in unique_companies[:5]:  # Top 5 companies get individual chunks
                     individual_chunk = f"Company: {company}"
-                    chunks.append(individual_chunk)
+                    chunks.append(Chunk(individual_chunk, 'company'))
         
         # Extract people names (capitalized words that look like names)
         name_pattern = r'\b([A-Z][a-z]+\s+[A-Z][a-z]+)\b'
@@ -285,71 +293,96 @@ class DatabaseManager:
             filtered_names = [name for name in set(names) if not any(word in name.lower() for word in ['april', 'standard', 'financial', 'chartered'])]
             if filtered_names:
                 name_chunk = "People: " + ", ".join(filtered_names)
-                chunks.append(name_chunk)
+                chunks.append(Chunk(name_chunk, 'people'))
         
         # Extract years and experience
         year_pattern = r'\b(\d{4})\s*-\s*(Present|\d{4})\b'
         years = re.findall(year_pattern, content)
         if years:
             year_chunk = "Timeline: " + ", ".join([f"{start}-{end}" for start, end in years])
-            chunks.append(year_chunk)
+            chunks.append(Chunk(year_chunk, 'timeline'))
         
         # Remove duplicates and very short chunks
         final_chunks = []
         seen = set()
         for chunk in chunks:
-            chunk_clean = chunk.strip()
+            chunk_clean = chunk.text.strip()
             if len(chunk_clean) >= 15 and chunk_clean.lower() not in seen:
                 seen.add(chunk_clean.lower())
-                final_chunks.append(chunk_clean)
+                final_chunks.append(Chunk(chunk_clean, chunk.kind))
         
         return final_chunks
     
+    def _chunk_search_sql(self, suffix: str = '', columns: str = '') -> str:
+        """
+        SQL of the prioritized chunk search. Parameter names get the given suffix and
+        extra select columns can be appended, so several copies can share one statement.
+        """
+        return f"""
+            SELECT DISTINCT
+                sp.url, sp.title, sp.content, sp.headings, sp.meta_description,
+                GROUP_CONCAT(DISTINCT cc.chunk_text ORDER BY cc.priority DESC SEPARATOR ' | ') as matching_chunks,
+                (
+                    -- Enhanced relevance scoring with chunk type weighting
+                    (CASE WHEN cc.chunk_type = 'title' THEN 20 ELSE 0 END) +
+                    (CASE WHEN cc.chunk_type = 'heading' THEN 15 ELSE 0 END) +
+                    (CASE WHEN cc.chunk_type = 'content' THEN 10 ELSE 0 END) +
+                    -- COMPANY DETECTION BOOST: Prioritize company-related chunks
+                    (CASE WHEN cc.chunk_text LIKE 'Companies:%' THEN 30 ELSE 0 END) +
+                    (CASE WHEN cc.chunk_text LIKE 'Company:%' THEN 25 ELSE 0 END) +
+                    (CASE WHEN cc.chunk_text REGEXP '\\b(Services|Tech|Technologies|Management|Plus|Digital|Corp|Inc|Ltd|LLC|Group|Solutions|Systems|Company)\\b' THEN 15 ELSE 0 END) +
+                    -- Boost exact matches heavily
+                    (CASE WHEN cc.chunk_text LIKE CONCAT('%%', :exact_query{suffix}, '%%') THEN 25 ELSE 0 END) +
+                    -- Boost title matches in main page
+                    (CASE WHEN sp.title LIKE CONCAT('%%', :exact_query{suffix}, '%%') THEN 20 ELSE 0 END) +
+                    -- Boost meta description matches
+                    (CASE WHEN sp.meta_description LIKE CONCAT('%%', :exact_query{suffix}, '%%') THEN 12 ELSE 0 END) +
+                    -- Full-text search bonus
+                    (CASE WHEN MATCH(cc.chunk_text) AGAINST(:query{suffix} IN NATURAL LANGUAGE MODE) > 0 THEN 15 ELSE 0 END)
+                ) * COUNT(DISTINCT cc.id) as relevance_score,
+                'chunk' as search_type{columns}
+            FROM content_chunks cc
+            JOIN scraped_pages sp ON cc.page_id = sp.id
+            WHERE (
+                -- Multi-strategy search for maximum coverage
+                cc.chunk_text LIKE CONCAT('%%', :exact_query{suffix}, '%%') OR
+                MATCH(cc.chunk_text) AGAINST(:query{suffix} IN NATURAL LANGUAGE MODE) OR
+                cc.chunk_text REGEXP :word_regex{suffix} OR
+                sp.title LIKE CONCAT('%%', :exact_query{suffix}, '%%') OR
+                sp.meta_description LIKE CONCAT('%%', :exact_query{suffix}, '%%') OR
+                sp.headings LIKE CONCAT('%%', :exact_query{suffix}, '%%')
+            )
+            AND sp.status = 'scraped'
+            GROUP BY sp.id, sp.url, sp.title, sp.content, sp.headings, sp.meta_description
+            HAVING relevance_score > 0
+            ORDER BY relevance_score DESC
+            LIMIT :limit{suffix}
+            """
+    
+    def _fulltext_search_sql(self, suffix: str = '', columns: str = '') -> str:
+        """SQL of the full-text fallback search, parameterized like _chunk_search_sql"""
+        return f"""
+            SELECT DISTINCT
+                url, title, content, headings, meta_description,
+                CONCAT(SUBSTRING(content, 1, 200), '...') as matching_chunks,
+                MATCH(title, content, meta_description, keywords)
+                AGAINST(:query{suffix} IN NATURAL LANGUAGE MODE) * 8 as relevance_score,
+                'fulltext' as search_type{columns}
+            FROM scraped_pages
+            WHERE MATCH(title, content, meta_description, keywords)
+            AGAINST(:query{suffix} IN NATURAL LANGUAGE MODE)
+            AND status = 'scraped'
+            AND url NOT IN :found_urls{suffix}
+            ORDER BY relevance_score DESC
+            LIMIT :remaining_limit{suffix}
+            """
+    
     def search_content(self, query: str, limit: int = 10) -> List[Dict]:
         """FIXED: Ultra-fast search with collation-safe queries and better chunk prioritization"""
         session = self.get_session()
         try:
             # STRATEGY 1: Prioritized chunk-based search (most accurate)
-            chunk_query = text("""
-                SELECT DISTINCT
-                    sp.url, sp.title, sp.content, sp.headings, sp.meta_description,
-                    GROUP_CONCAT(DISTINCT cc.chunk_text ORDER BY cc.priority DESC SEPARATOR ' | ') as matching_chunks,
-                    (
-                        -- Enhanced relevance scoring with chunk type weighting
-                        (CASE WHEN cc.chunk_type = 'title' THEN 20 ELSE 0 END) +
-                        (CASE WHEN cc.chunk_type = 'heading' THEN 15 ELSE 0 END) +
-                        (CASE WHEN cc.chunk_type = 'content' THEN 10 ELSE 0 END) +
-                        -- COMPANY DETECTION BOOST: Prioritize company-related chunks
-                        (CASE WHEN cc.chunk_text LIKE 'Companies:%' THEN 30 ELSE 0 END) +
-                        (CASE WHEN cc.chunk_text LIKE 'Company:%' THEN 25 ELSE 0 END) +
-                        (CASE WHEN cc.chunk_text REGEXP '\\b(Services|Tech|Technologies|Management|Plus|Digital|Corp|Inc|Ltd|LLC|Group|Solutions|Systems|Company)\\b' THEN 15 ELSE 0 END) +
-                        -- Boost exact matches heavily
-                        (CASE WHEN cc.chunk_text LIKE CONCAT('%%', :exact_query, '%%') THEN 25 ELSE 0 END) +
-                        -- Boost title matches in main page
-                        (CASE WHEN sp.title LIKE CONCAT('%%', :exact_query, '%%') THEN 20 ELSE 0 END) +
-                        -- Boost meta description matches
-                        (CASE WHEN sp.meta_description LIKE CONCAT('%%', :exact_query, '%%') THEN 12 ELSE 0 END) +
-                        -- Full-text search bonus
-                        (CASE WHEN MATCH(cc.chunk_text) AGAINST(:query IN NATURAL LANGUAGE MODE) > 0 THEN 15 ELSE 0 END)
-                    ) * COUNT(DISTINCT cc.id) as relevance_score,
-                    'chunk' as search_type
-                FROM content_chunks cc
-                JOIN scraped_pages sp ON cc.page_id = sp.id
-                WHERE (
-                    -- Multi-strategy search for maximum coverage
-                    cc.chunk_text LIKE CONCAT('%%', :exact_query, '%%') OR
-                    MATCH(cc.chunk_text) AGAINST(:query IN NATURAL LANGUAGE MODE) OR
-                    cc.chunk_text REGEXP :word_regex OR
-                    sp.title LIKE CONCAT('%%', :exact_query, '%%') OR
-                    sp.meta_description LIKE CONCAT('%%', :exact_query, '%%') OR
-                    sp.headings LIKE CONCAT('%%', :exact_query, '%%')
-                )
-                AND sp.status = 'scraped'
-                GROUP BY sp.id, sp.url, sp.title, sp.content, sp.headings, sp.meta_description
-                HAVING relevance_score > 0
-                ORDER BY relevance_score DESC
-                LIMIT :limit
-                """)
+            chunk_query = text(self._chunk_search_sql())
             
             # Execute chunk search first
             chunk_result = session.execute(chunk_query, {
@@ -364,37 +397,14 @@ class DatabaseManager:
             
             # Process chunk results
             for row in chunk_result:
-                results.append({
-                    'url': row.url,
-                    'title': row.title,
-                    'content': row.content,
-                    'headings': row.headings,
-                    'meta_description': row.meta_description,
-                    'matching_chunks': row.matching_chunks,
-                    'relevance_score': float(row.relevance_score),
-                    'search_type': row.search_type
-                })
+                results.append(self._search_result(row))
                 found_urls.add(row.url)
             
             # STRATEGY 2: Full-text fallback if we need more results
             if len(results) < limit:
                 remaining_limit = limit - len(results)
                 
-                fulltext_query = text("""
-                    SELECT DISTINCT
-                        url, title, content, headings, meta_description,
-                        CONCAT(SUBSTRING(content, 1, 200), '...') as matching_chunks,
-                        MATCH(title, content, meta_description, keywords)
-                        AGAINST(:query IN NATURAL LANGUAGE MODE) * 8 as relevance_score,
-                        'fulltext' as search_type
-                    FROM scraped_pages
-                    WHERE MATCH(title, content, meta_description, keywords)
-                    AGAINST(:query IN NATURAL LANGUAGE MODE)
-                    AND status = 'scraped'
-                    AND url NOT IN :found_urls
-                    ORDER BY relevance_score DESC
-                    LIMIT :remaining_limit
-                    """)
+                fulltext_query = text(self._fulltext_search_sql())
                 
                 if found_urls:  # Only if we have URLs to exclude
                     fulltext_result = session.execute(fulltext_query, {
@@ -405,16 +415,7 @@ class DatabaseManager:
                     
                     # Add fulltext results
                     for row in fulltext_result:
-                        results.append({
-                            'url': row.url,
-                            'title': row.title,
-                            'content': row.content,
-                            'headings': row.headings,
-                            'meta_description': row.meta_description,
-                            'matching_chunks': row.matching_chunks,
-                            'relevance_score': float(row.relevance_score),
-                            'search_type': row.search_type
-                        })
+                        results.append(self._search_result(row))
             
             # Sort final results by relevance
             results.sort(key=lambda x: x['relevance_score'], reverse=True)
@@ -447,18 +448,7 @@ class DatabaseManager:
                     'limit': limit
                 })
                 
-                fallback_results = []
-                for row in fallback_result:
-                    fallback_results.append({
-                        'url': row.url,
-                        'title': row.title,
-                        'content': row.content,
-                        'headings': row.headings,
-                        'meta_description': row.meta_description,
-                        'matching_chunks': row.matching_chunks,
-                        'relevance_score': float(row.relevance_score),
-                        'search_type': row.search_type
-                    })
+                fallback_results = [self._search_result(row) for row in fallback_result]
                 
                 logger.info(f"Fallback search found {len(fallback_results)} results")
                 return fallback_results
@@ -468,6 +458,79 @@ class DatabaseManager:
         finally:
             session.close()
     
+    def search_content_batch(self, queries: List[str], limit: int = 10) -> Dict[str, List[Dict]]:
+        """
+        search_content for several queries at once: each search stage runs every query
+        in a single UNION ALL statement, so N queries cost one round-trip per stage
+        """
+        if not queries:
+            return {}
+        
+        session = self.get_session()
+        try:
+            # STRATEGY 1: Prioritized chunk-based search, tagged with the query's index
+            chunk_parts = []
+            params = {}
+            for i, query in enumerate(queries):
+                chunk_parts.append(f"({self._chunk_search_sql(f'_{i}', f', {i} as batch_index')})")
+                params.update({
+                    f'exact_query_{i}': query,
+                    f'query_{i}': query,
+                    f'word_regex_{i}': '|'.join([word.strip() for word in query.split() if len(word.strip()) > 2]),
+                    f'limit_{i}': limit
+                })
+            chunk_result = session.execute(text(' UNION ALL '.join(chunk_parts)), params)
+            
+            results = [[] for _ in queries]
+            found_urls = [set() for _ in queries]
+            for row in chunk_result:
+                results[row.batch_index].append(self._search_result(row))
+                found_urls[row.batch_index].add(row.url)
+            
+            # STRATEGY 2: Full-text fallback for the queries that need more results
+            fulltext_parts = []
+            params = {}
+            for i, query in enumerate(queries):
+                if len(results[i]) < limit and found_urls[i]:  # Only if we have URLs to exclude
+                    fulltext_parts.append(f"({self._fulltext_search_sql(f'_{i}', f', {i} as batch_index')})")
+                    params.update({
+                        f'query_{i}': query,
+                        f'found_urls_{i}': tuple(found_urls[i]),
+                        f'remaining_limit_{i}': limit - len(results[i])
+                    })
+            if fulltext_parts:
+                fulltext_result = session.execute(text(' UNION ALL '.join(fulltext_parts)), params)
+                for row in fulltext_result:
+                    results[row.batch_index].append(self._search_result(row))
+            
+            batch_results = {}
+            for query, query_results in zip(queries, results):
+                # Sort final results by relevance
+                query_results.sort(key=lambda x: x['relevance_score'], reverse=True)
+                batch_results[query] = query_results[:limit]
+            
+            logger.info(f"Batch search found {sum(len(r) for r in batch_results.values())} results for {len(queries)} queries")
+            return batch_results
+            
+        except Exception as e:
+            logger.error(f"Batch search error, searching queries one by one: {e}")
+            return {query: self.search_content(query, limit) for query in queries}
+        finally:
+            session.close()
+    
+    def _search_result(self, row) -> Dict:
+        """Result dict for a row of the chunk, full-text or fallback search"""
+        return {
+            'url': row.url,
+            'title': row.title,
+            'content': row.content,
+            'headings': row.headings,
+            'meta_description': row.meta_description,
+            'matching_chunks': row.matching_chunks,
+            'relevance_score': float(row.relevance_score),
+            'search_type': row.search_type
+        }
+    
     def _fulltext_search(self, query: str, limit: int) -> List[Dict]:
         """Full-text search using MySQL MATCH AGAINST"""
         try:
@@ -92,6 +92,7 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Hybrid Chatbot Python Backend...")
     yield
     logger.info("Shutting down Hybrid Chatbot Python Backend...")
+    web_scraper.close()
 
 # Initialize FastAPI app
 app = FastAPI(
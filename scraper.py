@@ -5,17 +5,27 @@ Includes advanced techniques for JavaScript-rendered content, shadow DOM, and if
 """
 
 import asyncio
+import hashlib
+import io
 import logging
-import xml.etree.ElementTree as ET
+import multiprocessing
+import os
+import threading
 from typing import List, Dict, Optional, Set
 from urllib.parse import urljoin, urlparse
 import time
 import re
-import json
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
+import orjson
 import requests
 from bs4 import BeautifulSoup, Comment
+from bs4.builder import ParserRejectedMarkup
+from lxml import etree, html as lxml_html
 import httpx
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -33,12 +43,560 @@ except ImportError:
     SELENIUM_AVAILABLE = False
     print("Selenium not available. Install with: pip install selenium")
 
+# xxhash is optional; content fingerprints fall back to blake2b without it
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Common words that mark a data-* attribute value as readable text
+_DATA_ATTRIBUTE_WORDS = frozenset(['the', 'and', 'or', 'to', 'of', 'in', 'for'])
+
+# Text in CSS content properties (::before/::after)
+_CSS_CONTENT_RE = re.compile(r'content\s*:\s*["\']([^"\';]+)["\']')
+# Sentence boundaries used when merging content from several extraction methods
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Image sources that are decoration rather than page content
+_IMG_SKIP = re.compile(r'icon|logo|avatar|placeholder', re.IGNORECASE)
+
+# Structured-content selectors for the enhanced Selenium pass, each group joined
+# into one selector so it costs a single WebDriver call
+_SELENIUM_TIMELINE_SELECTOR = ', '.join([
+    '.timeline', '.experience', '.career', '.history', '.journey',
+    '.work-experience', '.professional-experience', '.job-history',
+    '.work', '.job', '.role'
+])
+_SELENIUM_CARD_SELECTOR = ', '.join([
+    '.card', '.section', '.panel', '.box', '.item', '.entry'
+])
+_SELENIUM_DATE_SELECTOR = ', '.join([
+    '[class*="date"]', '[class*="year"]', '[class*="time"]',
+    '.date', '.year', '.time', '.period', '.duration'
+])
+
+
+# Tag groups whose elements are extracted together, in document order
+_QUOTE_TAGS = frozenset(['blockquote', 'q', 'cite'])
+_MEDIA_TAGS = frozenset(['img', 'video', 'audio', 'source', 'track'])
+
+# Statuses servers answer HEAD with when they only allow GET
+_HEAD_REJECTED_STATUSES = frozenset([403, 405, 501])
+
+# URLs excluded from scraping by file extension or path fragment
+_EXCLUDE_EXT = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.zip', '.doc', '.docx', '.css', '.js', '.xml', '.rar')
+_EXCLUDE_PATHS = ('/wp-admin/', '/admin/', '/login', '/register/', '/cart', '/checkout', '/wp-content/', '/uploads/')
+
+# Keyword extraction: words of 4+ letters (any script), minus common stop words
+_TOKEN_RE = re.compile(r'[^\W\d_]{4,}')
+_STOP_WORDS = frozenset([
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are',
+    'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'
+])
+
+
+def _match_key(name: str) -> bool:
+    """Whether an attribute is one of the meaningful text attributes (data-*, aria-*, title, alt)"""
+    n = name.lower()
+    return n.startswith('data-') or n.startswith('aria-') or n == 'title' or n == 'alt'
+
+
+def _fingerprint(text: str):
+    """Case-insensitive fingerprint of a text snippet, used for deduplication"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(text.casefold())
+    return hashlib.blake2b(text.casefold().encode('utf-8'), digest_size=8).digest()
+
+
+def _make_soup(markup) -> BeautifulSoup:
+    """
+    Parse HTML with lxml, falling back to html5lib for markup lxml rejects.
+    Pass raw bytes where possible so the encoding is detected from the document itself.
+    """
+    try:
+        return BeautifulSoup(markup, 'lxml')
+    except ParserRejectedMarkup as e:
+        logger.debug(f"lxml rejected markup, retrying with html5lib: {e}")
+        return BeautifulSoup(markup, 'html5lib')
+
+
+def _lxml_parser(encoding: Optional[str]) -> Optional[lxml_html.HTMLParser]:
+    """HTML parser decoding with the given encoding, or None (lxml's default) if there is none"""
+    if encoding:
+        try:
+            return lxml_html.HTMLParser(encoding=encoding)
+        except LookupError:
+            logger.debug(f"lxml does not support encoding {encoding}, using its default")
+    return None
+
+
+@dataclass
+class _DomBuckets:
+    """Elements of a parsed page grouped for the extraction sections, each in document order"""
+    by_tag: Dict[str, list] = field(default_factory=lambda: defaultdict(list))
+    quotes: list = field(default_factory=list)
+    media: list = field(default_factory=list)
+    with_attributes: list = field(default_factory=list)
+
+
+def _bucket_dom(root) -> _DomBuckets:
+    """Walk an lxml tree once and sort its elements into buckets"""
+    buckets = _DomBuckets()
+    for elem in root.iter(etree.Element):
+        tag = elem.tag
+        buckets.by_tag[tag].append(elem)
+        if tag in _QUOTE_TAGS:
+            buckets.quotes.append(elem)
+        elif tag in _MEDIA_TAGS:
+            buckets.media.append(elem)
+        if elem.attrib:
+            buckets.with_attributes.append(elem)
+    return buckets
+
+
+def _extract_page_content(html: bytes, url: str) -> Dict:
+    """
+    Parse a fetched page and run the comprehensive extraction passes.
+    Module-level (and free of network access) so it can run in a worker process.
+    """
+    soup = _make_soup(html)
+    
+    # Remove only truly non-content elements (keep nav, footer for comprehensive scraping)
+    for element in soup(["script", "style", "noscript"]):
+        element.decompose()
+    
+    # Parallel lxml tree for the full-document and per-tag walks, which run in C
+    # instead of through BeautifulSoup's Python-level traversal; the soup is kept
+    # for the CSS-selector sections. lxml is given the encoding the soup detected, as on
+    # its own it reads bytes without a <meta charset> as latin-1
+    tree = lxml_html.fromstring(html, parser=_lxml_parser(soup.original_encoding))
+    for element in tree.xpath('//script | //style | //noscript'):
+        element.drop_tree()
+    body_tree = tree.find('body')
+    if body_tree is None:
+        body_tree = tree
+    dom = _bucket_dom(body_tree)
+    
+    # Extract title
+    title = soup.find('title')
+    title_text = title.get_text().strip() if title else ''
+    
+    # Extract ALL meta information
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    meta_description = meta_desc.get('content', '').strip() if meta_desc else ''
+    
+    # Extract meta keywords if available
+    meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
+    meta_keywords_text = meta_keywords.get('content', '').strip() if meta_keywords else ''
+    
+    # Extract ALL headings with hierarchy
+    headings = []
+    for level in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+        for heading in dom.by_tag[level]:
+            text = heading.text_content().strip()
+            if text:
+                headings.append(f"{level.upper()}: {text}")
+    
+    # Remove head section and focus on body content
+    head = soup.find('head')
+    if head:
+        head.decompose()
+    
+    # Focus on main content areas
+    body = soup.find('body')
+    if body:
+        soup = body
+    
+    # Enhanced content extraction - capture ALL content elements
+    content_parts = []
+    all_extracted_content = []  # Store all content without duplication checking initially
+    
+    # 1. PRIORITY CONTENT - Extract in order of importance
+    
+    # Main content areas (highest priority)
+    main_content_selectors = [
+        'main', 'article', '[role="main"]', '.main-content', '#main-content',
+        '.content', '#content', '.post-content', '.entry-content', '.page-content'
+    ]
+    
+    for selector in main_content_selectors:
+        main_elements = soup.select(selector)
+        for element in main_elements:
+            text = element.get_text(separator=' ', strip=True)
+            if text and len(text) > 20:
+                all_extracted_content.append(f"Main Content: {text}")
+    
+    # 2. HEADINGS - All levels with hierarchy
+    heading_tags = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+    for tag in heading_tags:
+        for heading in dom.by_tag[tag]:
+            text = heading.text_content().strip()
+            if text:
+                all_extracted_content.append(f"Heading {tag.upper()}: {text}")
+    
+    # 3. PARAGRAPHS - Every single paragraph
+    for p in dom.by_tag['p']:
+        text = p.text_content().strip()
+        if text:
+            all_extracted_content.append(f"Paragraph: {text}")
+    
+    # 4. SUBTITLES AND CAPTIONS - Various subtitle elements
+    subtitle_selectors = [
+        '.subtitle', '.sub-title', '.subheading', '.sub-heading',
+        '.caption', '.description', '.summary', '.excerpt',
+        'figcaption', '.figure-caption', '.wp-caption-text'
+    ]
+    
+    for selector in subtitle_selectors:
+        for element in soup.select(selector):
+            text = element.get_text().strip()
+            if text:
+                all_extracted_content.append(f"Subtitle/Caption: {text}")
+    
+    # 5. DATES AND YEARS - Specific date/time content
+    date_selectors = [
+        'time', '.date', '.published', '.updated', '.year',
+        '[datetime]', '.post-date', '.entry-date', '.timestamp'
+    ]
+    
+    for selector in date_selectors:
+        for element in soup.select(selector):
+            text = element.get_text().strip()
+            if text:
+                all_extracted_content.append(f"Date/Time: {text}")
+            # Also check datetime attribute
+            datetime_attr = element.get('datetime', '')
+            if datetime_attr:
+                all_extracted_content.append(f"DateTime Attribute: {datetime_attr}")
+    
+    # 6. LISTS - All list items with structure
+    for list_elem in soup.find_all(['ul', 'ol', 'dl']):
+        list_type = 'Ordered List' if list_elem.name == 'ol' else 'Unordered List' if list_elem.name == 'ul' else 'Definition List'
+        
+        if list_elem.name in ['ul', 'ol']:
+            for li in list_elem.find_all('li', recursive=False):
+                text = li.get_text().strip()
+                if text:
+                    all_extracted_content.append(f"{list_type} Item: {text}")
+        else:  # dl
+            for dt in list_elem.find_all('dt'):
+                dt_text = dt.get_text().strip()
+                if dt_text:
+                    all_extracted_content.append(f"Definition Term: {dt_text}")
+            for dd in list_elem.find_all('dd'):
+                dd_text = dd.get_text().strip()
+                if dd_text:
+                    all_extracted_content.append(f"Definition Description: {dd_text}")
+    
+    # 7. TABLES - Complete table content
+    for table in soup.find_all('table'):
+        # Table caption
+        caption = table.find('caption')
+        if caption:
+            caption_text = caption.get_text().strip()
+            if caption_text:
+                all_extracted_content.append(f"Table Caption: {caption_text}")
+        
+        # Table headers
+        for th in table.find_all('th'):
+            text = th.get_text().strip()
+            if text:
+                all_extracted_content.append(f"Table Header: {text}")
+        
+        # Table data
+        for tr in table.find_all('tr'):
+            row_data = []
+            for td in tr.find_all('td'):
+                cell_text = td.get_text().strip()
+                if cell_text:
+                    row_data.append(cell_text)
+            if row_data:
+                all_extracted_content.append(f"Table Row: {' | '.join(row_data)}")
+    
+    # 8. EMPHASIZED TEXT - All emphasis elements
+    emphasis_tags = ['strong', 'b', 'em', 'i', 'mark', 'ins', 'del', 'u', 'small', 'big']
+    for tag in emphasis_tags:
+        for elem in dom.by_tag[tag]:
+            text = elem.text_content().strip()
+            if text:
+                all_extracted_content.append(f"Emphasized ({tag.upper()}): {text}")
+    
+    # 9. QUOTES AND CITATIONS
+    for quote in dom.quotes:
+        text = quote.text_content().strip()
+        if text:
+            all_extracted_content.append(f"Quote/Citation ({quote.tag}): {text}")
+    
+    # 10. FORM ELEMENTS - All interactive content
+    form_elements = ['label', 'button', 'input', 'textarea', 'select', 'option', 'legend', 'fieldset']
+    for tag in form_elements:
+        for elem in soup.find_all(tag):
+            text = elem.get_text().strip()
+            if text:
+                all_extracted_content.append(f"Form Element ({tag}): {text}")
+            
+            # Extract important attributes
+            for attr in ['value', 'placeholder', 'title', 'alt', 'label']:
+                attr_value = elem.get(attr, '').strip()
+                if attr_value and len(attr_value) > 1:
+                    all_extracted_content.append(f"Form {attr.title()}: {attr_value}")
+    
+    # 11. MEDIA CONTENT - Images, videos, audio
+    for media in dom.media:
+        for attr in ['alt', 'title', 'data-caption', 'aria-label', 'aria-describedby']:
+            attr_value = media.get(attr, '').strip()
+            if attr_value:
+                all_extracted_content.append(f"Media {attr.title()}: {attr_value}")
+    
+    # 12. LINKS - All link text and titles
+    for link in dom.by_tag['a']:
+        link_text = link.text_content().strip()
+        if link_text:
+            all_extracted_content.append(f"Link Text: {link_text}")
+        
+        title = link.get('title', '').strip()
+        if title:
+            all_extracted_content.append(f"Link Title: {title}")
+    
+    # 13. METADATA AND STRUCTURED DATA
+    for elem in soup.find_all(['meta', 'script']):
+        if elem.name == 'meta':
+            content = elem.get('content', '').strip()
+            name = elem.get('name', elem.get('property', '')).strip()
+            if content and name and len(content) > 3:
+                all_extracted_content.append(f"Meta {name}: {content}")
+        elif elem.name == 'script' and elem.get('type') == 'application/ld+json':
+            # Extract JSON-LD structured data
+            try:
+                json_data = orjson.loads(elem.string or '')
+                if isinstance(json_data, dict):
+                    for key, value in json_data.items():
+                        if isinstance(value, str) and len(value) > 3:
+                            all_extracted_content.append(f"Structured Data {key}: {value}")
+            except orjson.JSONDecodeError:
+                pass
+    
+    # 14. SPECIAL ATTRIBUTES - Data attributes and ARIA labels
+    # (also collects the readable data attributes of section 17 in the same walk)
+    for elem in dom.with_attributes:
+        if elem is body_tree:
+            continue
+        for attr_name, attr_value in elem.attrib.items():
+            if len(attr_value.strip()) > 3:
+                attr_text = attr_value.strip()
+                # Focus on meaningful attributes
+                if _match_key(attr_name):
+                    if ' ' in attr_text or len(attr_text) > 10:  # Likely to be readable text
+                        all_extracted_content.append(f"Attribute {attr_name}: {attr_text}")
+                
+                # 17. DATA ATTRIBUTES WITH TEXT CONTENT - readable text contains spaces and common words
+                if (attr_name.startswith('data-') and len(attr_text) > 10 and ' ' in attr_value
+                        and _DATA_ATTRIBUTE_WORDS.intersection(attr_value.lower().split())):
+                    all_extracted_content.append(f"Data Attribute {attr_name}: {attr_text}")
+    
+    # 15. IFRAME CONTENT - same-domain iframe URLs; fetched by the scraper afterwards
+    iframe_urls = []
+    for iframe in soup.find_all('iframe'):
+        iframe_src = iframe.get('src', '')
+        if iframe_src:
+            # Make iframe src absolute
+            iframe_url = urljoin(url, iframe_src)
+            # Only scrape same-domain iframes for security
+            if urlparse(iframe_url).netloc == urlparse(url).netloc:
+                iframe_urls.append(iframe_url)
+    
+    # 16. COMMENTS - HTML comments that might contain content
+    comments = soup.find_all(string=lambda text: isinstance(text, Comment))
+    for comment in comments:
+        comment_text = comment.strip()
+        if comment_text and len(comment_text) > 10 and not any(skip in comment_text.lower() for skip in ['copyright', 'generator', 'version']):
+            all_extracted_content.append(f"HTML Comment: {comment_text}")
+    
+    # 18. NOSCRIPT CONTENT - Content for users without JavaScript
+    for noscript in soup.find_all('noscript'):
+        noscript_text = noscript.get_text(separator=' ', strip=True)
+        if noscript_text and len(noscript_text) > 10:
+            all_extracted_content.append(f"NoScript Content: {noscript_text}")
+    
+    # 19. CSS CONTENT - Extract text from CSS content properties
+    for style_tag in soup.find_all('style'):
+        if style_tag.string:
+            # Look for content: "text" in CSS
+            css_content_matches = re.findall(r'content:\s*["\']([^"\'\n\r]+)["\']', style_tag.string)
+            for match in css_content_matches:
+                if len(match.strip()) > 3:
+                    all_extracted_content.append(f"CSS Content: {match.strip()}")
+    
+    # 20. JAVASCRIPT VARIABLES - Extract text from JS variables (basic extraction)
+    for script_tag in soup.find_all('script'):
+        if script_tag.string and 'text' in script_tag.string.lower():
+            # Look for common patterns like var text = "content" or text: "content"
+            js_text_matches = re.findall(r'(?:text|content|title|description)\s*[:=]\s*["\']([^"\'\n\r]{10,})["\']', script_tag.string, re.IGNORECASE)
+            for match in js_text_matches:
+                clean_text = match.strip()
+                if clean_text and not any(skip in clean_text.lower() for skip in ['function', 'var ', 'const ', 'let ']):
+                    all_extracted_content.append(f"JavaScript Text: {clean_text}")
+
+    # 21. STRUCTURED CONTENT - Timeline, cards, and experience sections
+    # Exact class matches only - substring selectors like [class*="item"] match most
+    # of the document and re-extract the same text many times over
+    timeline_selectors = [
+        '.timeline', '.experience', '.career', '.history', '.journey',
+        '.work-experience', '.professional-experience', '.job-history',
+        '.work', '.job', '.role'
+    ]
+    
+    for selector in timeline_selectors:
+        for element in soup.select(selector):
+            # Extract all text content including nested elements
+            timeline_text = element.get_text(separator=' | ', strip=True)
+            if timeline_text and len(timeline_text) > 10:
+                all_extracted_content.append(f"Timeline/Experience: {timeline_text}")
+
+    # 22. CARD/SECTION CONTENT - Structured information in cards or sections
+    card_selectors = [
+        '.card', '.section', '.panel', '.box', '.item', '.entry',
+        '.post', '.article-item', '.content-block', '.info-box'
+    ]
+    
+    for selector in card_selectors:
+        for element in soup.select(selector):
+            card_text = element.get_text(separator=' | ', strip=True)
+            if card_text and len(card_text) > 15:
+                all_extracted_content.append(f"Card/Section: {card_text}")
+
+    # 23. DATE AND YEAR EXTRACTION - Specific patterns for dates and years
+    date_patterns = [
+        r'\b(19|20)\d{2}\b',  # Years like 2012, 2014, etc.
+        r'\b(19|20)\d{2}\s*[-–—]\s*(PRESENT|present|Present|Current|current|Now|now)\b',  # 2012-PRESENT
+        r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(19|20)\d{2}\b',  # Month Year
+        r'\b\d{1,2}[/\-]\d{1,2}[/\-](19|20)\d{2}\b'  # Date formats
+    ]
+    
+    page_text = soup.get_text()
+    for pattern in date_patterns:
+        matches = re.findall(pattern, page_text, re.IGNORECASE)
+        for match in matches:
+            if isinstance(match, tuple):
+                match_text = ' '.join(str(m) for m in match if m)
+            else:
+                match_text = str(match)
+            if len(match_text) > 3:
+                all_extracted_content.append(f"Date/Year: {match_text}")
+
+    # 24. JAVASCRIPT DATA EXTRACTION - Look for JSON data in script tags
+    for script_tag in soup.find_all('script'):
+        if script_tag.string:
+            script_content = script_tag.string
+            # Look for JSON-like structures
+            json_patterns = [
+                r'"title"\s*:\s*"([^"]+)"',
+                r'"name"\s*:\s*"([^"]+)"',
+                r'"company"\s*:\s*"([^"]+)"',
+                r'"role"\s*:\s*"([^"]+)"',
+                r'"position"\s*:\s*"([^"]+)"',
+                r'"year"\s*:\s*"([^"]+)"',
+                r'"date"\s*:\s*"([^"]+)"',
+                r'"experience"\s*:\s*"([^"]+)"'
+            ]
+            
+            for pattern in json_patterns:
+                matches = re.findall(pattern, script_content, re.IGNORECASE)
+                for match in matches:
+                    if len(match) > 3:
+                        all_extracted_content.append(f"JS Data: {match}")
+
+    # 25. CSS PSEUDO-CONTENT - Extract content from CSS ::before and ::after
+    for style_tag in soup.find_all('style'):
+        if style_tag.string:
+            css_content = style_tag.string
+            # Look for content properties that might contain text
+            content_matches = _CSS_CONTENT_RE.findall(css_content)
+            for match in content_matches:
+                if len(match) > 2 and not match.startswith('\\'):
+                    all_extracted_content.append(f"CSS Content: {match}")
+
+    # 26. ARIA LABELS AND ACCESSIBILITY CONTENT
+    for element in dom.with_attributes:
+        if element is body_tree:
+            continue
+        for attr in ['aria-label', 'aria-describedby', 'title', 'data-title', 'data-label']:
+            attr_value = element.get(attr, '')
+            if attr_value and len(attr_value) > 5:
+                all_extracted_content.append(f"Accessibility Content ({attr}): {attr_value}")
+
+    # 27. FINAL SWEEP - Brute-force capture of all body text to ensure nothing is missed.
+    # This acts as a final catch-all to guarantee 100% text coverage.
+    if soup.body:
+        body_text = soup.body.get_text(separator=' ', strip=True)
+        if body_text and len(body_text) > 20:
+            all_extracted_content.append(f"Complete Body Text: {body_text}")
+    
+    # Combine all content and remove exact duplicates while preserving order
+    seen_content = set()
+    final_content = []
+    
+    for content in all_extracted_content:
+        # Compare case-insensitive fingerprints but keep original formatting
+        fingerprint = _fingerprint(content)
+        if fingerprint not in seen_content and len(content.strip()) > 3:
+            seen_content.add(fingerprint)
+            final_content.append(content)
+    
+    # If there is not enough content, keep the complete page text as a fallback
+    complete_page_text = ''
+    if len('\n'.join(final_content)) < 500:
+        complete_page_text = soup.get_text(separator=' ', strip=True)
+    
+    # Extract first meaningful image
+    image_url = ''
+    for img in dom.by_tag['img']:
+        src = img.get('src', '')
+        if src and not _IMG_SKIP.search(src):
+            image_url = urljoin(url, src)
+            break
+    
+    return {
+        'title': title_text,
+        'meta_description': meta_description,
+        'meta_keywords': meta_keywords_text,
+        'headings': headings,
+        'content': final_content,
+        'iframe_urls': iframe_urls,
+        'complete_page_text': complete_page_text,
+        'image_url': image_url
+    }
+
+
+def _extract_text(html: bytes) -> str:
+    """Plain text of an HTML document (used for iframe content)"""
+    return _make_soup(html).get_text(separator=' ', strip=True)
+
+
+def _extract_with_parsers(html: bytes) -> Dict[str, str]:
+    """
+    Text of a page body from the comprehensive extraction and a plain lxml pass.
+    html5lib is only tried when both of those come back short.
+    """
+    results = {
+        'standard': '\n'.join(_extract_page_content(html, '')['content']),
+        'lxml': BeautifulSoup(html, 'lxml').get_text(separator=' ', strip=True)
+    }
+    if len(results['standard']) < 500 and len(results['lxml']) < 500:
+        results['html5lib'] = BeautifulSoup(html, 'html5lib').get_text(separator=' ', strip=True)
+    return results
+
 
 class WebScraper:
     """Enhanced web scraper for extracting content from sitemaps and individual pages with 100% accuracy"""
     
+    # Upper bound on extraction worker processes per scraper
+    MAX_EXTRACTION_WORKERS = 4
+    
     def __init__(self, max_concurrent: int = 10, timeout: int = 30, use_selenium: bool = True):
         self.max_concurrent = max_concurrent
         self.timeout = timeout
@@ -46,12 +604,73 @@ class WebScraper:
         self.session = self._create_session()
         # Disable SSL warnings for sites with certificate issues
         requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
-        self.driver = None
-        
-        # Initialize Selenium driver if available and requested
-        if self.use_selenium:
-            self._init_selenium_driver()
+        # Selenium driver is started lazily on first access, see the driver property
+        self._driver = None
+        self._driver_lock = threading.Lock()
+        # Process pool for HTML extraction, created on first scrape, see _get_extraction_pool
+        self._pool = None
+        self._pool_available = True
         
+    @property
+    def driver(self):
+        """
+        Selenium WebDriver, initialized on first use so scrapers that never need it do not
+        start Chrome. Starting it takes seconds; async callers access it from a worker thread.
+        """
+        if self._driver is None and self.use_selenium:
+            with self._driver_lock:
+                # Concurrent first scrapes must not each start a browser
+                if self._driver is None and self.use_selenium:
+                    self._init_selenium_driver()
+        return self._driver
+    
+    def _get_extraction_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Process pool for page extraction, or None (default thread executor) where processes are unavailable"""
+        if self._pool is None and self._pool_available:
+            try:
+                # spawn, not fork: the server process already runs threads (uvicorn, Selenium,
+                # thread pools), and forking a threaded process can deadlock the child.
+                # Spawned workers re-import the __main__ module, so when the server is started
+                # as `python main.py` each worker repeats main.py's module-level setup (Gemini,
+                # WebScraper, DatabaseManager); a __main__ that cannot be re-imported (e.g. code
+                # read from stdin) breaks the pool, and _run_extraction falls back to threads
+                self._pool = ProcessPoolExecutor(
+                    max_workers=min(self.MAX_EXTRACTION_WORKERS, os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            except (OSError, NotImplementedError) as e:
+                # e.g. serverless runtimes without /dev/shm
+                logger.warning(f"Process pool unavailable, extracting in threads: {e}")
+                self._pool_available = False
+        return self._pool
+    
+    def _discard_pool(self, pool: ProcessPoolExecutor):
+        """Drop a broken pool so the next extraction creates a fresh one"""
+        pool.shutdown(wait=False)
+        if self._pool is pool:
+            self._pool = None
+    
+    async def _run_extraction(self, func, *args):
+        """
+        Run an extraction function in the process pool. A broken pool (worker killed, crashed
+        or unable to start) is replaced and the call retried once; if the new pool breaks too,
+        extraction moves to the default thread executor for the rest of the scraper's life.
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            pool = self._get_extraction_pool()
+            if pool is None:
+                break
+            try:
+                return await loop.run_in_executor(pool, func, *args)
+            except BrokenProcessPool as e:
+                logger.warning(f"Extraction process pool broke, replacing it: {e}")
+                self._discard_pool(pool)
+        else:
+            logger.warning("Replacement process pool broke as well, extracting in threads")
+            self._pool_available = False
+        return await loop.run_in_executor(None, func, *args)
+    
     def _create_session(self) -> requests.Session:
         """Create a requests session with retry strategy"""
         session = requests.Session()
@@ -63,9 +682,11 @@ class WebScraper:
             status_forcelist=[429, 500, 502, 503, 504],
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Larger connection pool so concurrent page fetches (and their iframes) against the
+        # same host reuse keep-alive connections instead of queueing behind urllib3's default of 10
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=64, pool_maxsize=64, pool_block=False)
         session.mount("http://", adapter)
-        session.mount("https://", HTTPAdapter(max_retries=retry_strategy))
+        session.mount("https://", adapter)
 
         # --- SECURITY WORKAROUND ---
         # The following line disables SSL certificate verification.
@@ -89,7 +710,7 @@ class WebScraper:
         """Initialize Selenium WebDriver for JavaScript-rendered content"""
         try:
             chrome_options = Options()
-            chrome_options.add_argument('--headless')
+            chrome_options.add_argument('--headless=new')
             chrome_options.add_argument('--no-sandbox')
             chrome_options.add_argument('--disable-dev-shm-usage')
             # --- SECURITY WORKAROUND ---
@@ -100,14 +721,23 @@ class WebScraper:
             # ---------------------------
             chrome_options.add_argument('--disable-gpu')
             chrome_options.add_argument('--window-size=1920,1080')
+            # Text extraction never needs images or extensions
+            chrome_options.add_argument('--disable-extensions')
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
             
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.set_page_load_timeout(self.timeout)
+            self._driver = webdriver.Chrome(options=chrome_options)
+            self._driver.set_page_load_timeout(self.timeout)
             logger.info("Selenium WebDriver initialized successfully")
         except Exception as e:
             logger.warning(f"Failed to initialize Selenium WebDriver: {e}")
             self.use_selenium = False
-            self.driver = None
+            self._driver = None
+    
+    def reset_session(self):
+        """Clear cookies so one scraper (and its browser) can be reused across sites"""
+        self.session.cookies.clear()
+        if self._driver:
+            self._driver.delete_all_cookies()
     
     def extract_urls_from_sitemap(self, sitemap_url: str) -> List[str]:
         """Extract all URLs from a sitemap.xml file"""
@@ -124,9 +754,15 @@ class WebScraper:
                     f"{base_url}/sitemap-index.xml"
                 ]
                 
+                # Probe with HEAD so missing candidates don't cost a full body download;
+                # the sitemap itself is fetched once below
                 for candidate_url in sitemap_candidates:
                     try:
-                        response = self.session.get(candidate_url, timeout=self.timeout)
+                        response = self.session.head(candidate_url, timeout=self.timeout, allow_redirects=True)
+                        if response.status_code in _HEAD_REJECTED_STATUSES:
+                            # Server refuses HEAD; GET the headers only, the body is never read
+                            with self.session.get(candidate_url, timeout=self.timeout, stream=True) as response:
+                                pass
                         if response.status_code == 200:
                             sitemap_url = candidate_url
                             logger.info(f"Found sitemap at: {sitemap_url}")
@@ -138,18 +774,25 @@ class WebScraper:
                     logger.warning(f"No sitemap found, will scrape base URL: {base_url}")
                     return [base_url]
             
-            response = self.session.get(sitemap_url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            # Clean the XML content to handle malformed XML
-            xml_content = response.content
+            page_urls = []
+            sitemap_locs = []
             try:
-                # Try to parse as-is first
-                root = ET.fromstring(xml_content)
-            except ET.ParseError as e:
+                # Stream the sitemap through lxml's incremental parser instead of buffering the
+                # whole document in memory (sitemap indexes can be tens of megabytes)
+                with self.session.get(sitemap_url, timeout=self.timeout, stream=True) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    for is_page_url, loc in self._iter_sitemap_locs(response.raw):
+                        (page_urls if is_page_url else sitemap_locs).append(loc)
+            except etree.XMLSyntaxError as e:
                 logger.warning(f"XML parse error, attempting to clean content: {e}")
+                page_urls = []
+                sitemap_locs = []
+                response = self.session.get(sitemap_url, timeout=self.timeout)
+                response.raise_for_status()
+                
                 # Clean common XML issues
-                xml_text = xml_content.decode('utf-8', errors='ignore')
+                xml_text = response.content.decode('utf-8', errors='ignore')
                 # Remove invalid characters and fix common issues
                 xml_text = ''.join(char for char in xml_text if ord(char) >= 32 or char in '\t\n\r')
                 xml_text = xml_text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
@@ -162,10 +805,10 @@ class WebScraper:
                 xml_text = xml_text.replace('&lt;/urlset&gt;', '</urlset>').replace('&lt;/sitemapindex&gt;', '</sitemapindex>')
                 
                 try:
-                    root = ET.fromstring(xml_text.encode('utf-8'))
-                except ET.ParseError:
+                    for is_page_url, loc in self._iter_sitemap_locs(io.BytesIO(xml_text.encode('utf-8'))):
+                        (page_urls if is_page_url else sitemap_locs).append(loc)
+                except etree.XMLSyntaxError:
                     # If still failing, try to extract URLs with regex as fallback
-                    import re
                     urls = re.findall(r'<loc>(.*?)</loc>', xml_text)
                     if urls:
                         logger.info(f"Extracted {len(urls)} URLs using regex fallback")
@@ -177,36 +820,16 @@ class WebScraper:
                         return [base_url]
             
             # Handle different sitemap formats
-            urls = []
+            urls = page_urls
             
-            # Standard sitemap namespace
-            namespaces = {
-                'sitemap': 'http://www.sitemaps.org/schemas/sitemap/0.9'
-            }
-            
-            # Try to find URLs with namespace
-            url_elements = root.findall('.//sitemap:url/sitemap:loc', namespaces)
-            if url_elements:
-                urls.extend([elem.text for elem in url_elements if elem.text])
-            else:
-                # Try without namespace (some sitemaps don't use it properly)
-                url_elements = root.findall('.//url/loc')
-                if url_elements:
-                    urls.extend([elem.text for elem in url_elements if elem.text])
-                else:
-                    # Try to find sitemap index
-                    sitemap_elements = root.findall('.//sitemap:sitemap/sitemap:loc', namespaces)
-                    if not sitemap_elements:
-                        sitemap_elements = root.findall('.//sitemap/loc')
-                    
-                    # If it's a sitemap index, recursively fetch sub-sitemaps
-                    for sitemap_elem in sitemap_elements:
-                        if sitemap_elem.text:
-                            try:
-                                sub_urls = self.extract_urls_from_sitemap(sitemap_elem.text)
-                                urls.extend(sub_urls)
-                            except Exception as e:
-                                logger.warning(f"Failed to fetch sub-sitemap {sitemap_elem.text}: {e}")
+            if not urls:
+                # If it's a sitemap index, recursively fetch sub-sitemaps
+                for sub_sitemap_url in sitemap_locs:
+                    try:
+                        sub_urls = self.extract_urls_from_sitemap(sub_sitemap_url)
+                        urls.extend(sub_urls)
+                    except Exception as e:
+                        logger.warning(f"Failed to fetch sub-sitemap {sub_sitemap_url}: {e}")
             
             logger.info(f"Found {len(urls)} URLs in sitemap")
             return list(set(urls))  # Remove duplicates
@@ -215,448 +838,84 @@ class WebScraper:
             logger.error(f"Error extracting URLs from sitemap {sitemap_url}: {e}")
             raise
     
+    def _iter_sitemap_locs(self, source):
+        """Incrementally parse a sitemap, yielding (is_page_url, loc) for each <url>/<sitemap> entry"""
+        # {*} matches both namespaced and namespace-less sitemaps
+        for _, elem in etree.iterparse(source, tag=('{*}url', '{*}sitemap'), huge_tree=True):
+            loc = elem.findtext('{*}loc')
+            if loc and loc.strip():
+                yield etree.QName(elem).localname == 'url', loc.strip()
+            
+            # Free entries as soon as they are read to keep memory flat on large sitemaps
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    
     async def scrape_page_content(self, url: str) -> dict:
         """Scrape ALL visible content from a single page - comprehensive extraction"""
         try:
             # Use requests session synchronously in async context
-            import asyncio
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(None, lambda: self.session.get(url, timeout=30))
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Remove only truly non-content elements (keep nav, footer for comprehensive scraping)
-            for element in soup(["script", "style", "noscript"]):
-                element.decompose()
-            
-            # Extract title
-            title = soup.find('title')
-            title_text = title.get_text().strip() if title else ''
-            
-            # Extract ALL meta information
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            meta_description = meta_desc.get('content', '').strip() if meta_desc else ''
-            
-            # Extract meta keywords if available
-            meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-            meta_keywords_text = meta_keywords.get('content', '').strip() if meta_keywords else ''
-            
-            # Extract ALL headings with hierarchy
-            headings = []
-            for level in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                for heading in soup.find_all(level):
-                    text = heading.get_text().strip()
-                    if text:
-                        headings.append(f"{level.upper()}: {text}")
-            
-            # Remove head section and focus on body content
-            head = soup.find('head')
-            if head:
-                head.decompose()
-            
-            # Focus on main content areas
-            body = soup.find('body')
-            if body:
-                soup = body
-            
-            # Enhanced content extraction - capture ALL content elements
-            content_parts = []
-            all_extracted_content = []  # Store all content without duplication checking initially
-            
-            # 1. PRIORITY CONTENT - Extract in order of importance
-            
-            # Main content areas (highest priority)
-            main_content_selectors = [
-                'main', 'article', '[role="main"]', '.main-content', '#main-content',
-                '.content', '#content', '.post-content', '.entry-content', '.page-content'
-            ]
-            
-            for selector in main_content_selectors:
-                main_elements = soup.select(selector)
-                for element in main_elements:
-                    text = element.get_text(separator=' ', strip=True)
-                    if text and len(text) > 20:
-                        all_extracted_content.append(f"Main Content: {text}")
-            
-            # 2. HEADINGS - All levels with hierarchy
-            heading_tags = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
-            for tag in heading_tags:
-                for heading in soup.find_all(tag):
-                    text = heading.get_text().strip()
-                    if text:
-                        all_extracted_content.append(f"Heading {tag.upper()}: {text}")
-            
-            # 3. PARAGRAPHS - Every single paragraph
-            for p in soup.find_all('p'):
-                text = p.get_text().strip()
-                if text:
-                    all_extracted_content.append(f"Paragraph: {text}")
-            
-            # 4. SUBTITLES AND CAPTIONS - Various subtitle elements
-            subtitle_selectors = [
-                '.subtitle', '.sub-title', '.subheading', '.sub-heading',
-                '.caption', '.description', '.summary', '.excerpt',
-                'figcaption', '.figure-caption', '.wp-caption-text'
-            ]
-            
-            for selector in subtitle_selectors:
-                for element in soup.select(selector):
-                    text = element.get_text().strip()
-                    if text:
-                        all_extracted_content.append(f"Subtitle/Caption: {text}")
-            
-            # 5. DATES AND YEARS - Specific date/time content
-            date_selectors = [
-                'time', '.date', '.published', '.updated', '.year',
-                '[datetime]', '.post-date', '.entry-date', '.timestamp'
-            ]
-            
-            for selector in date_selectors:
-                for element in soup.select(selector):
-                    text = element.get_text().strip()
-                    if text:
-                        all_extracted_content.append(f"Date/Time: {text}")
-                    # Also check datetime attribute
-                    datetime_attr = element.get('datetime', '')
-                    if datetime_attr:
-                        all_extracted_content.append(f"DateTime Attribute: {datetime_attr}")
-            
-            # 6. LISTS - All list items with structure
-            for list_elem in soup.find_all(['ul', 'ol', 'dl']):
-                list_type = 'Ordered List' if list_elem.name == 'ol' else 'Unordered List' if list_elem.name == 'ul' else 'Definition List'
-                
-                if list_elem.name in ['ul', 'ol']:
-                    for li in list_elem.find_all('li', recursive=False):
-                        text = li.get_text().strip()
-                        if text:
-                            all_extracted_content.append(f"{list_type} Item: {text}")
-                else:  # dl
-                    for dt in list_elem.find_all('dt'):
-                        dt_text = dt.get_text().strip()
-                        if dt_text:
-                            all_extracted_content.append(f"Definition Term: {dt_text}")
-                    for dd in list_elem.find_all('dd'):
-                        dd_text = dd.get_text().strip()
-                        if dd_text:
-                            all_extracted_content.append(f"Definition Description: {dd_text}")
-            
-            # 7. TABLES - Complete table content
-            for table in soup.find_all('table'):
-                # Table caption
-                caption = table.find('caption')
-                if caption:
-                    caption_text = caption.get_text().strip()
-                    if caption_text:
-                        all_extracted_content.append(f"Table Caption: {caption_text}")
-                
-                # Table headers
-                for th in table.find_all('th'):
-                    text = th.get_text().strip()
-                    if text:
-                        all_extracted_content.append(f"Table Header: {text}")
-                
-                # Table data
-                for tr in table.find_all('tr'):
-                    row_data = []
-                    for td in tr.find_all('td'):
-                        cell_text = td.get_text().strip()
-                        if cell_text:
-                            row_data.append(cell_text)
-                    if row_data:
-                        all_extracted_content.append(f"Table Row: {' | '.join(row_data)}")
-            
-            # 8. EMPHASIZED TEXT - All emphasis elements
-            emphasis_tags = ['strong', 'b', 'em', 'i', 'mark', 'ins', 'del', 'u', 'small', 'big']
-            for tag in emphasis_tags:
-                for elem in soup.find_all(tag):
-                    text = elem.get_text().strip()
-                    if text:
-                        all_extracted_content.append(f"Emphasized ({tag.upper()}): {text}")
-            
-            # 9. QUOTES AND CITATIONS
-            for quote in soup.find_all(['blockquote', 'q', 'cite']):
-                text = quote.get_text().strip()
-                if text:
-                    all_extracted_content.append(f"Quote/Citation ({quote.name}): {text}")
-            
-            # 10. FORM ELEMENTS - All interactive content
-            form_elements = ['label', 'button', 'input', 'textarea', 'select', 'option', 'legend', 'fieldset']
-            for tag in form_elements:
-                for elem in soup.find_all(tag):
-                    text = elem.get_text().strip()
-                    if text:
-                        all_extracted_content.append(f"Form Element ({tag}): {text}")
-                    
-                    # Extract important attributes
-                    for attr in ['value', 'placeholder', 'title', 'alt', 'label']:
-                        attr_value = elem.get(attr, '').strip()
-                        if attr_value and len(attr_value) > 1:
-                            all_extracted_content.append(f"Form {attr.title()}: {attr_value}")
-            
-            # 11. MEDIA CONTENT - Images, videos, audio
-            for media in soup.find_all(['img', 'video', 'audio', 'source', 'track']):
-                for attr in ['alt', 'title', 'data-caption', 'aria-label', 'aria-describedby']:
-                    attr_value = media.get(attr, '').strip()
-                    if attr_value:
-                        all_extracted_content.append(f"Media {attr.title()}: {attr_value}")
-            
-            # 12. LINKS - All link text and titles
-            for link in soup.find_all('a'):
-                link_text = link.get_text().strip()
-                if link_text:
-                    all_extracted_content.append(f"Link Text: {link_text}")
-                
-                title = link.get('title', '').strip()
-                if title:
-                    all_extracted_content.append(f"Link Title: {title}")
-            
-            # 13. METADATA AND STRUCTURED DATA
-            for elem in soup.find_all(['meta', 'script']):
-                if elem.name == 'meta':
-                    content = elem.get('content', '').strip()
-                    name = elem.get('name', elem.get('property', '')).strip()
-                    if content and name and len(content) > 3:
-                        all_extracted_content.append(f"Meta {name}: {content}")
-                elif elem.name == 'script' and elem.get('type') == 'application/ld+json':
-                    # Extract JSON-LD structured data
-                    try:
-                        import json
-                        json_data = json.loads(elem.string or '')
-                        if isinstance(json_data, dict):
-                            for key, value in json_data.items():
-                                if isinstance(value, str) and len(value) > 3:
-                                    all_extracted_content.append(f"Structured Data {key}: {value}")
-                    except:
-                        pass
-            
-            # 14. SPECIAL ATTRIBUTES - Data attributes and ARIA labels
-            for elem in soup.find_all():
-                for attr_name, attr_value in elem.attrs.items():
-                    if isinstance(attr_value, str) and len(attr_value.strip()) > 3:
-                        attr_text = attr_value.strip()
-                        # Focus on meaningful attributes
-                        if any(keyword in attr_name.lower() for keyword in ['data-', 'aria-', 'title', 'alt']):
-                            if ' ' in attr_text or len(attr_text) > 10:  # Likely to be readable text
-                                all_extracted_content.append(f"Attribute {attr_name}: {attr_text}")
-            
-            # 15. IFRAME CONTENT - Extract content from iframes
-            for iframe in soup.find_all('iframe'):
-                iframe_src = iframe.get('src', '')
-                if iframe_src:
-                    try:
-                        # Make iframe src absolute
-                        iframe_url = urljoin(url, iframe_src)
-                        # Only scrape same-domain iframes for security
-                        if urlparse(iframe_url).netloc == urlparse(url).netloc:
-                            iframe_response = self.session.get(iframe_url, timeout=10)
-                            if iframe_response.status_code == 200:
-                                iframe_soup = BeautifulSoup(iframe_response.content, 'html.parser')
-                                iframe_text = iframe_soup.get_text(separator=' ', strip=True)
-                                if iframe_text and len(iframe_text) > 20:
-                                    all_extracted_content.append(f"Iframe Content: {iframe_text}")
-                    except Exception as e:
-                        logger.debug(f"Failed to extract iframe content from {iframe_src}: {e}")
-            
-            # 16. COMMENTS - HTML comments that might contain content
-            comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-            for comment in comments:
-                comment_text = comment.strip()
-                if comment_text and len(comment_text) > 10 and not any(skip in comment_text.lower() for skip in ['copyright', 'generator', 'version']):
-                    all_extracted_content.append(f"HTML Comment: {comment_text}")
-            
-            # 17. DATA ATTRIBUTES WITH TEXT CONTENT
-            for elem in soup.find_all():
-                for attr_name, attr_value in elem.attrs.items():
-                    if isinstance(attr_value, str) and attr_name.startswith('data-') and len(attr_value.strip()) > 10:
-                        # Check if it looks like readable text (contains spaces and common words)
-                        if ' ' in attr_value and any(word in attr_value.lower() for word in ['the', 'and', 'or', 'to', 'of', 'in', 'for']):
-                            all_extracted_content.append(f"Data Attribute {attr_name}: {attr_value.strip()}")
-            
-            # 18. NOSCRIPT CONTENT - Content for users without JavaScript
-            for noscript in soup.find_all('noscript'):
-                noscript_text = noscript.get_text(separator=' ', strip=True)
-                if noscript_text and len(noscript_text) > 10:
-                    all_extracted_content.append(f"NoScript Content: {noscript_text}")
-            
-            # 19. CSS CONTENT - Extract text from CSS content properties
-            for style_tag in soup.find_all('style'):
-                if style_tag.string:
-                    # Look for content: "text" in CSS
-                    css_content_matches = re.findall(r'content:\s*["\']([^"\'\n\r]+)["\']', style_tag.string)
-                    for match in css_content_matches:
-                        if len(match.strip()) > 3:
-                            all_extracted_content.append(f"CSS Content: {match.strip()}")
-            
-            # 20. JAVASCRIPT VARIABLES - Extract text from JS variables (basic extraction)
-            for script_tag in soup.find_all('script'):
-                if script_tag.string and 'text' in script_tag.string.lower():
-                    # Look for common patterns like var text = "content" or text: "content"
-                    js_text_matches = re.findall(r'(?:text|content|title|description)\s*[:=]\s*["\']([^"\'\n\r]{10,})["\']', script_tag.string, re.IGNORECASE)
-                    for match in js_text_matches:
-                        clean_text = match.strip()
-                        if clean_text and not any(skip in clean_text.lower() for skip in ['function', 'var ', 'const ', 'let ']):
-                            all_extracted_content.append(f"JavaScript Text: {clean_text}")
-
-            # 21. STRUCTURED CONTENT - Timeline, cards, and experience sections
-            timeline_selectors = [
-                '.timeline', '.experience', '.career', '.history', '.journey',
-                '.work-experience', '.professional-experience', '.job-history',
-                '[class*="timeline"]', '[class*="experience"]', '[class*="career"]',
-                '[class*="work"]', '[class*="job"]', '[class*="role"]'
-            ]
-            
-            for selector in timeline_selectors:
-                for element in soup.select(selector):
-                    # Extract all text content including nested elements
-                    timeline_text = element.get_text(separator=' | ', strip=True)
-                    if timeline_text and len(timeline_text) > 10:
-                        all_extracted_content.append(f"Timeline/Experience: {timeline_text}")
-                    
-                    # Also extract individual child elements for better structure
-                    for child in element.find_all(['div', 'span', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                        child_text = child.get_text(strip=True)
-                        if child_text and len(child_text) > 3:
-                            all_extracted_content.append(f"Timeline Item: {child_text}")
-
-            # 22. CARD/SECTION CONTENT - Structured information in cards or sections
-            card_selectors = [
-                '.card', '.section', '.panel', '.box', '.item', '.entry',
-                '.post', '.article-item', '.content-block', '.info-box',
-                '[class*="card"]', '[class*="section"]', '[class*="item"]',
-                '[class*="box"]', '[class*="panel"]'
-            ]
-            
-            for selector in card_selectors:
-                for element in soup.select(selector):
-                    card_text = element.get_text(separator=' | ', strip=True)
-                    if card_text and len(card_text) > 15:
-                        all_extracted_content.append(f"Card/Section: {card_text}")
-
-            # 23. DATE AND YEAR EXTRACTION - Specific patterns for dates and years
-            import re
-            date_patterns = [
-                r'\b(19|20)\d{2}\b',  # Years like 2012, 2014, etc.
-                r'\b(19|20)\d{2}\s*[-–—]\s*(PRESENT|present|Present|Current|current|Now|now)\b',  # 2012-PRESENT
-                r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\w*\s+(19|20)\d{2}\b',  # Month Year
-                r'\b\d{1,2}[/\-]\d{1,2}[/\-](19|20)\d{2}\b'  # Date formats
-            ]
-            
-            page_text = soup.get_text()
-            for pattern in date_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                for match in matches:
-                    if isinstance(match, tuple):
-                        match_text = ' '.join(str(m) for m in match if m)
-                    else:
-                        match_text = str(match)
-                    if len(match_text) > 3:
-                        all_extracted_content.append(f"Date/Year: {match_text}")
-
-            # 24. JAVASCRIPT DATA EXTRACTION - Look for JSON data in script tags
-            for script_tag in soup.find_all('script'):
-                if script_tag.string:
-                    script_content = script_tag.string
-                    # Look for JSON-like structures
-                    json_patterns = [
-                        r'"title"\s*:\s*"([^"]+)"',
-                        r'"name"\s*:\s*"([^"]+)"',
-                        r'"company"\s*:\s*"([^"]+)"',
-                        r'"role"\s*:\s*"([^"]+)"',
-                        r'"position"\s*:\s*"([^"]+)"',
-                        r'"year"\s*:\s*"([^"]+)"',
-                        r'"date"\s*:\s*"([^"]+)"',
-                        r'"experience"\s*:\s*"([^"]+)"'
-                    ]
-                    
-                    for pattern in json_patterns:
-                        matches = re.findall(pattern, script_content, re.IGNORECASE)
-                        for match in matches:
-                            if len(match) > 3:
-                                all_extracted_content.append(f"JS Data: {match}")
-
-            # 25. CSS PSEUDO-CONTENT - Extract content from CSS ::before and ::after
-            for style_tag in soup.find_all('style'):
-                if style_tag.string:
-                    css_content = style_tag.string
-                    # Look for content properties that might contain text
-                    content_matches = re.findall(r'content\s*:\s*["\']([^"\';]+)["\']', css_content)
-                    for match in content_matches:
-                        if len(match) > 2 and not match.startswith('\\'):
-                            all_extracted_content.append(f"CSS Content: {match}")
-
-            # 26. ARIA LABELS AND ACCESSIBILITY CONTENT
-            for element in soup.find_all():
-                for attr in ['aria-label', 'aria-describedby', 'title', 'data-title', 'data-label']:
-                    attr_value = element.get(attr, '')
-                    if attr_value and len(attr_value) > 5:
-                        all_extracted_content.append(f"Accessibility Content ({attr}): {attr_value}")
-
-            # 27. FINAL SWEEP - Brute-force capture of all body text to ensure nothing is missed.
-            # This acts as a final catch-all to guarantee 100% text coverage.
-            if soup.body:
-                body_text = soup.body.get_text(separator=' ', strip=True)
-                if body_text and len(body_text) > 20:
-                    all_extracted_content.append(f"Complete Body Text: {body_text}")
-            
-            # Combine all content and remove exact duplicates while preserving order
-            seen_content = set()
-            final_content = []
-            
-            for content in all_extracted_content:
-                # Normalize for comparison but keep original formatting
-                normalized = ' '.join(content.lower().split())
-                if normalized not in seen_content and len(content.strip()) > 3:
-                    seen_content.add(normalized)
-                    final_content.append(content)
+            # Parsing and extraction are CPU-bound; run them in a worker process so the
+            # event loop keeps issuing fetches for the other pages meanwhile
+            page = await self._run_extraction(_extract_page_content, response.content, url)
+            title_text = page['title']
+            meta_description = page['meta_description']
+            meta_keywords_text = page['meta_keywords']
+            headings = page['headings']
+            final_content = page['content']
+            
+            # 15. IFRAME CONTENT - Extract content from same-domain iframes (fetched concurrently)
+            iframe_texts = await asyncio.gather(
+                *[self._scrape_iframe(iframe_url) for iframe_url in page['iframe_urls']]
+            )
+            for iframe_text in iframe_texts:
+                if iframe_text and len(iframe_text) > 20:
+                    final_content.append(f"Iframe Content: {iframe_text}")
             
-            # Join all content
-            content_text = '\n'.join(final_content)
+            # Collect the content sections and join them once at the end
+            parts = ['\n'.join(final_content)]
             
-            # Enhanced Selenium extraction for structured content
-            if self.use_selenium and self.driver:
+            # Enhanced Selenium extraction for structured content. The first scrape starts
+            # Chrome, which is done in a worker thread to keep the event loop responsive
+            if self.use_selenium and await loop.run_in_executor(None, lambda: self.driver):
                 try:
                     logger.info(f"Using Selenium for enhanced content extraction on {url}")
                     selenium_content = self._extract_with_selenium_enhanced(url)
                     if selenium_content and len(selenium_content) > 100:
-                        content_text += '\n\nEnhanced JavaScript Content:\n' + selenium_content
+                        parts.append('Enhanced JavaScript Content:\n' + selenium_content)
                 except Exception as e:
                     logger.debug(f"Enhanced Selenium extraction failed for {url}: {e}")
             
             # If still not enough content, get complete page text as final fallback
-            if len(content_text) < 500:
-                complete_page_text = soup.get_text(separator=' ', strip=True)
-                if len(complete_page_text) > len(content_text):
-                    content_text += '\n\nComplete Page Text:\n' + complete_page_text
+            content_length = sum(len(part) for part in parts) + 2 * (len(parts) - 1)
+            if content_length < 500:
+                complete_page_text = page['complete_page_text']
+                if len(complete_page_text) > content_length:
+                    parts.append('Complete Page Text:\n' + complete_page_text)
+            
+            content_text = '\n\n'.join(parts)
             
             # Extract comprehensive keywords
             all_text = f"{title_text} {meta_description} {' '.join(headings)} {content_text}"
-            words = all_text.lower().split()
-            
-            # Filter and count words
-            word_freq = {}
-            stop_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those'}
             
-            for word in words:
-                word = word.strip('.,!?;:"()[]{}').lower()
-                if len(word) > 3 and word not in stop_words and word.isalpha():
-                    word_freq[word] = word_freq.get(word, 0) + 1
+            # Tokenize and count words
+            word_freq = Counter(_TOKEN_RE.findall(all_text.lower()))
+            for stop_word in _STOP_WORDS:
+                word_freq.pop(stop_word, None)
             
             # Get top keywords
-            keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:30]
+            keywords = word_freq.most_common(30)
             keywords_text = ', '.join([word for word, freq in keywords])
             
             # Add meta keywords if available
             if meta_keywords_text:
                 keywords_text = f"{meta_keywords_text}, {keywords_text}"
             
-            # Extract first meaningful image
-            image_url = ''
-            for img in soup.find_all('img'):
-                src = img.get('src', '')
-                if src and not any(skip in src.lower() for skip in ['icon', 'logo', 'avatar', 'placeholder']):
-                    image_url = urljoin(url, src)
-                    break
+            image_url = page['image_url']
             
             logger.info(f"Comprehensively scraped {len(content_text)} characters from {url}")
             
@@ -683,32 +942,37 @@ class WebScraper:
                 'keywords': None
             }
     
+    async def _scrape_iframe(self, iframe_url: str) -> str:
+        """Fetch a same-domain iframe and return its text, or '' on failure"""
+        loop = asyncio.get_event_loop()
+        try:
+            iframe_response = await loop.run_in_executor(None, lambda: self.session.get(iframe_url, timeout=10))
+            if iframe_response.status_code == 200:
+                return await self._run_extraction(_extract_text, iframe_response.content)
+        except Exception as e:
+            logger.debug(f"Failed to extract iframe content from {iframe_url}: {e}")
+        return ''
+    
     async def scrape_pages_async(self, urls: List[str]) -> List[Dict[str, Optional[str]]]:
         """Scrape multiple pages asynchronously"""
         semaphore = asyncio.Semaphore(self.max_concurrent)
+        completed = 0
+        total = len(urls)
         
         async def scrape_single_async(url: str) -> Dict[str, Optional[str]]:
+            nonlocal completed
             async with semaphore:
                 # Use the async scrape_page_content method directly
-                return await self.scrape_page_content(url)
-        
-        # Create tasks for all URLs
-        tasks = [scrape_single_async(url) for url in urls]
-        
-        # Execute with progress logging
-        results = []
-        completed = 0
-        total = len(tasks)
-        
-        for task in asyncio.as_completed(tasks):
-            result = await task
-            results.append(result)
-            completed += 1
+                result = await self.scrape_page_content(url)
             
+            # Progress logging
+            completed += 1
             if completed % 10 == 0 or completed == total:
                 logger.info(f"Scraped {completed}/{total} pages")
+            return result
         
-        return results
+        # Results come back in the same order as urls
+        return await asyncio.gather(*[scrape_single_async(url) for url in urls])
     
     async def scrape_from_sitemap(self, sitemap_url: str) -> List[Dict[str, Optional[str]]]:
         """Complete workflow: extract URLs from sitemap and scrape all pages"""
@@ -742,19 +1006,17 @@ class WebScraper:
     def _filter_urls(self, urls: List[str]) -> List[str]:
         """Filter URLs to exclude unwanted pages"""
         filtered = []
-        exclude_extensions = {'.pdf', '.jpg', '.jpeg', '.png', '.gif', '.zip', '.doc', '.docx'}
-        exclude_paths = {'/wp-admin/', '/admin/', '/login/', '/register/', '/cart/', '/checkout/'}
         
         for url in urls:
             try:
-                parsed = urlparse(url)
+                path = urlparse(url).path.lower()
                 
                 # Skip if has excluded extension
-                if any(parsed.path.lower().endswith(ext) for ext in exclude_extensions):
+                if path.endswith(_EXCLUDE_EXT):
                     continue
                 
                 # Skip if has excluded path
-                if any(excluded in parsed.path.lower() for excluded in exclude_paths):
+                if any(excluded in path for excluded in _EXCLUDE_PATHS):
                     continue
                 
                 # Skip if URL is too long (likely dynamic)
@@ -775,9 +1037,31 @@ class WebScraper:
         words2 = set(text2.split())
         if not words1 or not words2:
             return 0.0
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        return len(intersection) / len(union)
+        # |A ∪ B| = |A| + |B| - |A ∩ B|, so the union set is never built
+        overlap = len(words1.intersection(words2))
+        return overlap / (len(words1) + len(words2) - overlap)
+    
+    def _wait_for_page_settled(self, load_timeout: int, max_idle_wait: float, idle_time: float = 0.5):
+        """
+        Wait for document.readyState to be complete, then until the page has not
+        started loading any new resource for idle_time seconds (at most max_idle_wait)
+        """
+        WebDriverWait(self.driver, load_timeout).until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete"
+        )
+        
+        deadline = time.monotonic() + max_idle_wait
+        last_count = None
+        settled_since = time.monotonic()
+        while time.monotonic() < deadline:
+            count = self.driver.execute_script("return performance.getEntriesByType('resource').length")
+            now = time.monotonic()
+            if count != last_count:
+                last_count = count
+                settled_since = now
+            elif now - settled_since >= idle_time:
+                return
+            time.sleep(0.1)
     
     def _extract_with_selenium(self, url: str) -> str:
         """Extract content using Selenium for JavaScript-rendered pages"""
@@ -787,20 +1071,13 @@ class WebScraper:
         try:
             self.driver.get(url)
             
-            # Wait for page to load and JavaScript to execute
-            WebDriverWait(self.driver, 10).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
-            
-            # Additional wait for dynamic content
-            time.sleep(2)
-            
-            # Get page source after JavaScript execution
-            page_source = self.driver.page_source
-            selenium_soup = BeautifulSoup(page_source, 'html.parser')
+            # Wait for page to load and JavaScript to execute, then for dynamic content
+            self._wait_for_page_settled(load_timeout=10, max_idle_wait=2)
             
-            # Extract text content
-            selenium_content = selenium_soup.get_text(separator=' ', strip=True)
+            # Visible text as rendered by the browser, no need to re-parse page_source
+            selenium_content = self.driver.find_element(By.TAG_NAME, 'body').text.strip()
+            if not selenium_content:
+                selenium_content = _make_soup(self.driver.page_source).get_text(separator=' ', strip=True)
             
             # Also try to extract any dynamically loaded content
             dynamic_elements = self.driver.find_elements(By.CSS_SELECTOR, 
@@ -832,88 +1109,57 @@ class WebScraper:
         try:
             self.driver.get(url)
             
-            # Wait for page to load completely
-            WebDriverWait(self.driver, 15).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
-            
-            # Additional wait for dynamic content and animations
-            time.sleep(3)
+            # Wait for page to load completely, then for dynamic content and animations
+            self._wait_for_page_settled(load_timeout=15, max_idle_wait=3)
             
             # Try to trigger any lazy loading or dynamic content
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
+            self._wait_for_page_settled(load_timeout=15, max_idle_wait=1)
             self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
             
             enhanced_content = []
             
-            # 1. Extract structured timeline/experience content
-            timeline_selectors = [
-                '[class*="timeline"]', '[class*="experience"]', '[class*="career"]',
-                '[class*="work"]', '[class*="job"]', '[class*="role"]',
-                '.timeline', '.experience', '.career', '.history', '.journey',
-                '.work-experience', '.professional-experience', '.job-history'
-            ]
-            
-            for selector in timeline_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        element_text = element.text.strip()
-                        if element_text and len(element_text) > 10:
-                            enhanced_content.append(f"Timeline/Experience: {element_text}")
-                except:
-                    continue
-            
-            # 2. Extract card/section content
-            card_selectors = [
-                '[class*="card"]', '[class*="section"]', '[class*="item"]',
-                '[class*="box"]', '[class*="panel"]', '[class*="entry"]',
-                '.card', '.section', '.panel', '.box', '.item', '.entry'
+            # 1-3. Structured timeline/experience, card/section and date/year content;
+            # one find_elements call per group keeps WebDriver round trips down
+            selector_groups = [
+                (_SELENIUM_TIMELINE_SELECTOR, 'Timeline/Experience', 10),
+                (_SELENIUM_CARD_SELECTOR, 'Card/Section', 15),
+                (_SELENIUM_DATE_SELECTOR, 'Date/Time', 2)
             ]
             
-            for selector in card_selectors:
+            for selector, label, min_length in selector_groups:
                 try:
                     elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
                     for element in elements:
                         element_text = element.text.strip()
-                        if element_text and len(element_text) > 15:
-                            enhanced_content.append(f"Card/Section: {element_text}")
-                except:
-                    continue
-            
-            # 3. Extract date/year elements specifically
-            date_selectors = [
-                '[class*="date"]', '[class*="year"]', '[class*="time"]',
-                '.date', '.year', '.time', '.period', '.duration'
-            ]
-            
-            for selector in date_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        element_text = element.text.strip()
-                        if element_text and len(element_text) > 2:
-                            enhanced_content.append(f"Date/Time: {element_text}")
+                        if element_text and len(element_text) > min_length:
+                            enhanced_content.append(f"{label}: {element_text}")
                 except:
                     continue
             
             # 4. Extract any elements with data attributes that might contain structured info
+            # (all values collected in the browser with a single script call)
             try:
-                data_elements = self.driver.find_elements(By.CSS_SELECTOR, '[data-title], [data-role], [data-company], [data-year], [data-date]')
-                for element in data_elements:
-                    for attr in ['data-title', 'data-role', 'data-company', 'data-year', 'data-date']:
-                        try:
-                            attr_value = element.get_attribute(attr)
-                            if attr_value and len(attr_value) > 3:
-                                enhanced_content.append(f"Data Attribute ({attr}): {attr_value}")
-                        except:
-                            continue
+                data_attributes = self.driver.execute_script("""
+                    var attrs = ['data-title', 'data-role', 'data-company', 'data-year', 'data-date'];
+                    var selector = attrs.map(function(attr) { return '[' + attr + ']'; }).join(',');
+                    var values = [];
+                    document.querySelectorAll(selector).forEach(function(el) {
+                        attrs.forEach(function(attr) {
+                            if (el.hasAttribute(attr)) values.push([attr, el.getAttribute(attr)]);
+                        });
+                    });
+                    return values;
+                """)
+                for attr, attr_value in data_attributes or []:
+                    if attr_value and len(attr_value) > 3:
+                        enhanced_content.append(f"Data Attribute ({attr}): {attr_value}")
             except:
                 pass
             
-            # 5. Execute JavaScript to extract any data from window objects
+            # 5. Execute JavaScript to extract any data from window objects, and the quoted
+            # key/value pairs (e.g. "company": "Acme") from scripts about experience, timelines
+            # or careers; scripts are scanned in the browser so only the matches come back
             try:
                 js_data = self.driver.execute_script("""
                     var data = [];
@@ -923,23 +1169,17 @@ class WebScraper:
                     if (window.timelineData) data.push('Timeline Data: ' + JSON.stringify(window.timelineData));
                     if (window.profileData) data.push('Profile Data: ' + JSON.stringify(window.profileData));
                     
-                    // Look for data in common variable names
-                    try {
-                        var scripts = document.querySelectorAll('script');
-                        for (var i = 0; i < scripts.length; i++) {
-                            var script = scripts[i].textContent || scripts[i].innerText;
-                            if (script && (script.includes('experience') || script.includes('timeline') || script.includes('career'))) {
-                                // Extract JSON-like data
-                                var matches = script.match(/["'](?:title|name|company|role|position|year|date)["']\\s*:\\s*["']([^"']+)["']/gi);
-                                if (matches) {
-                                    matches.forEach(function(match) {
-                                        data.push('JS Variable: ' + match);
-                                    });
-                                }
-                            }
+                    var pattern = /["'](?:title|name|company|role|position|year|date)["']\\s*:\\s*["']([^"']+)["']/gi;
+                    Array.prototype.forEach.call(document.scripts, function(script) {
+                        var text = script.textContent || '';
+                        if (text.indexOf('experience') === -1 && text.indexOf('timeline') === -1 &&
+                                text.indexOf('career') === -1) return;
+                        var match;
+                        pattern.lastIndex = 0;
+                        while ((match = pattern.exec(text)) !== null) {
+                            data.push('JS Variable: ' + match[0]);
                         }
-                    } catch(e) {}
-                    
+                    });
                     return data;
                 """)
                 
@@ -954,17 +1194,23 @@ class WebScraper:
             logger.error(f"Enhanced Selenium extraction error for {url}: {e}")
             return ""
     
+    def _fetch_bytes(self, url: str) -> bytes:
+        """Fetch a page body once for all the extraction methods"""
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.content
+
     def extract_with_multiple_methods(self, url: str) -> Dict[str, str]:
         """Extract content using multiple methods and combine results"""
         results = {}
         
-        # Method 1: Standard requests + BeautifulSoup
+        # Methods 1 and 3: comprehensive extraction and raw parser text, from one fetch
         try:
-            standard_result = self.scrape_page_content_sync(url)
-            results['standard'] = standard_result.get('content', '')
+            results.update(_extract_with_parsers(self._fetch_bytes(url)))
         except Exception as e:
-            logger.error(f"Standard extraction failed for {url}: {e}")
+            logger.error(f"Parser extraction failed for {url}: {e}")
             results['standard'] = ''
+            results['lxml'] = ''
         
         # Method 2: Selenium (if available)
         if self.use_selenium:
@@ -975,24 +1221,8 @@ class WebScraper:
                 logger.error(f"Selenium extraction failed for {url}: {e}")
                 results['selenium'] = ''
         
-        # Method 3: Raw text extraction with different parsers
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-            if response.status_code == 200:
-                # Try with lxml parser
-                lxml_soup = BeautifulSoup(response.content, 'lxml')
-                results['lxml'] = lxml_soup.get_text(separator=' ', strip=True)
-                
-                # Try with html5lib parser
-                html5lib_soup = BeautifulSoup(response.content, 'html5lib')
-                results['html5lib'] = html5lib_soup.get_text(separator=' ', strip=True)
-        except Exception as e:
-            logger.error(f"Alternative parser extraction failed for {url}: {e}")
-            results['lxml'] = ''
-            results['html5lib'] = ''
-        
         return results
-    
+
     def get_best_content(self, url: str) -> str:
         """Get the most comprehensive content by combining multiple extraction methods"""
         all_results = self.extract_with_multiple_methods(url)
@@ -1013,131 +1243,29 @@ class WebScraper:
         for method, content in all_results.items():
             if content:
                 # Split into sentences and add unique ones
-                sentences = re.split(r'[.!?]+', content)
+                sentences = _SENT_SPLIT_RE.split(content)
                 for sentence in sentences:
                     sentence = sentence.strip()
                     if len(sentence) > 20:
-                        sentence_key = ' '.join(sentence.lower().split()[:10])  # First 10 words as key
+                        sentence_key = _fingerprint(' '.join(sentence.split(None, 10)[:10]))  # First 10 words as key
                         if sentence_key not in seen_sentences:
                             seen_sentences.add(sentence_key)
                             combined_content.append(sentence)
         
         return '\n'.join(combined_content) if combined_content else best_content
 
-    def _filter_urls(self, urls: list) -> list:
-        """Filter URLs to exclude unwanted pages"""
-        exclude_extensions = ['.pdf', '.jpg', '.jpeg', '.png', '.gif', '.css', '.js', '.xml', '.zip', '.rar']
-        exclude_paths = ['/wp-content/', '/uploads/', '/admin/', '/login', '/cart', '/checkout']
-        filtered = []
-        for url in urls:
-            try:
-                parsed = urlparse(url)
-                if any(parsed.path.lower().endswith(ext) for ext in exclude_extensions):
-                    continue
-                if any(excluded in parsed.path.lower() for excluded in exclude_paths):
-                    continue
-                if len(url) > 200:
-                    continue
-                filtered.append(url)
-            except Exception:
-                continue
-        return filtered
-
-    def _text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two texts using simple word overlap"""
-        words1 = set(text1.split())
-        words2 = set(text2.split())
-        if not words1 or not words2:
-            return 0.0
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        return len(intersection) / len(union)
-
-    def _extract_with_selenium(self, url: str) -> str:
-        """Extract content using Selenium for JavaScript-rendered pages"""
-        if not self.driver:
-            return ""
-        try:
-            self.driver.get(url)
-            WebDriverWait(self.driver, 10).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
-            time.sleep(2)
-            page_source = self.driver.page_source
-            selenium_soup = BeautifulSoup(page_source, 'html.parser')
-            selenium_content = selenium_soup.get_text(separator=' ', strip=True)
-            dynamic_elements = self.driver.find_elements(By.CSS_SELECTOR, '[data-loaded], [data-content], .dynamic-content, .lazy-loaded')
-            dynamic_text = []
-            for element in dynamic_elements:
-                try:
-                    element_text = element.text.strip()
-                    if element_text and len(element_text) > 10:
-                        dynamic_text.append(element_text)
-                except:
-                    continue
-            if dynamic_text:
-                selenium_content += '\n\nDynamic Content:\n' + '\n'.join(dynamic_text)
-            return selenium_content
-        except Exception as e:
-            logger.error(f"Selenium extraction error for {url}: {e}")
-            return ""
-
-    def extract_with_multiple_methods(self, url: str) -> Dict[str, str]:
-        """Extract content using multiple methods and combine results"""
-        results = {}
-        try:
-            standard_result = self.scrape_page_content_sync(url)
-            results['standard'] = standard_result.get('content', '')
-        except Exception as e:
-            logger.error(f"Standard extraction failed for {url}: {e}")
-            results['standard'] = ''
-        if self.use_selenium:
-            try:
-                selenium_content = self._extract_with_selenium(url)
-                results['selenium'] = selenium_content
-            except Exception as e:
-                logger.error(f"Selenium extraction failed for {url}: {e}")
-                results['selenium'] = ''
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-            if response.status_code == 200:
-                lxml_soup = BeautifulSoup(response.content, 'lxml')
-                results['lxml'] = lxml_soup.get_text(separator=' ', strip=True)
-                html5lib_soup = BeautifulSoup(response.content, 'html5lib')
-                results['html5lib'] = html5lib_soup.get_text(separator=' ', strip=True)
-        except Exception as e:
-            logger.error(f"Alternative parser extraction failed for {url}: {e}")
-            results['lxml'] = ''
-            results['html5lib'] = ''
-        return results
-
-    def get_best_content(self, url: str) -> str:
-        """Get the most comprehensive content by combining multiple extraction methods"""
-        all_results = self.extract_with_multiple_methods(url)
-        best_content = ""
-        best_length = 0
-        for method, content in all_results.items():
-            if content and len(content) > best_length:
-                best_content = content
-                best_length = len(content)
-        combined_content = []
-        seen_sentences = set()
-        for method, content in all_results.items():
-            if content:
-                sentences = re.split(r'[.!?]+', content)
-                for sentence in sentences:
-                    sentence = sentence.strip()
-                    if len(sentence) > 20:
-                        sentence_key = ' '.join(sentence.lower().split()[:10])
-                        if sentence_key not in seen_sentences:
-                            seen_sentences.add(sentence_key)
-                            combined_content.append(sentence)
-        return '\n'.join(combined_content) if combined_content else best_content
+    def close(self):
+        """Quit the Selenium driver and shut down the extraction pool, if they were started"""
+        if getattr(self, '_driver', None):
+            self._driver.quit()
+            self._driver = None
+        if getattr(self, '_pool', None):
+            self._pool.shutdown(wait=False)
+            self._pool = None
 
     def __del__(self):
-        # Clean up Selenium driver on exit
-        if self.driver:
-            self.driver.quit()
+        # Clean up on exit (without starting a driver or pool that was never used)
+        self.close()
 
 if __name__ == '__main__':
     import sys
@@ -1162,13 +1290,13 @@ if __name__ == '__main__':
     website_urls = sys.argv[1:]
 
     async def main():
+        # One scraper (and one Chrome) for every website; cookies and session
+        # data are cleared between sites so nothing leaks from one to the next.
+        scraper = WebScraper(use_selenium=True)
+        
         for url in website_urls:
             print(f"--- Starting Scraping for Website: {url} ---\n")
             
-            # Create a NEW, ISOLATED scraper instance for each website.
-            # This prevents cookies and session data from leaking between sites.
-            scraper = WebScraper(use_selenium=True)
-            
             try:
                 # Run the asynchronous scraping function
                 scraped_data = await scraper.scrape_page_content(url)
@@ -1181,8 +1309,8 @@ if __name__ == '__main__':
             except Exception as e:
                 print(f"An error occurred while scraping {url}: {e}")
             finally:
-                # Clean up the scraper instance for the current site
-                del scraper
+                # Reset cookies before the next site
+                scraper.reset_session()
 
     # Run the main async function that processes all websites
     asyncio.run(main())
@@ -4,21 +4,94 @@ Advanced AI-powered content analysis for comprehensive information extraction
 """
 
 import re
-import json
+import sys
+import copy
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Set, Tuple, Any
 import logging
 from datetime import datetime
+import orjson
+from lxml import etree
+
+# google-re2 matches in linear time, which helps the large alternations; optional
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# xxhash is optional; analysis cache keys fall back to blake2b without it
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Shared by every analyzer on free-threaded builds only: the extractors are pure-Python
+# regex work, which gains nothing from threads while the GIL is held
+if not getattr(sys, '_is_gil_enabled', lambda: True)():
+    _EXTRACTOR_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='smart-extractor')
+else:
+    _EXTRACTOR_POOL = None
+
+# Patterns that do not depend on an analyzer's keyword configuration, compiled once at import
+
+# Contact information: one scan, the named group that matched is the contact type.
+# Phones and websites are only tried at a character they can start with.
+_CONTACT_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?=[+(\d])(?P<phone>(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+    r'|(?=[hHwW])(?P<website>(?i:https?://[^\s<>"\']+|www\.[^\s<>"\']+\.[a-z]{2,}))'
+)
+
+# Entity names: leading articles, stripped in this order, each at most once
+_NAME_PREFIXES_RE = re.compile(r'(?:the )?(?:a )?(?:an )?', re.IGNORECASE)
+
+# Structured data: cheap check for markup worth handing to the HTML parser
+_STRUCTURED_TAG_RE = re.compile(r'<(?:script|meta)\b', re.IGNORECASE)
+
+
+def _compile_linear(pattern: str, flags: int = 0):
+    """Compile a pattern with RE2 when it is installed and supports it, otherwise with re"""
+    if RE2_AVAILABLE:
+        # re2 takes an Options object rather than re flags; IGNORECASE is the only one used here
+        options = re2.Options()
+        if flags & re.IGNORECASE:
+            options.case_sensitive = False
+        try:
+            return re2.compile(pattern, options)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
+def _content_key(content: str):
+    """Cheap fixed-size key identifying a content payload in the analysis cache"""
+    if XXHASH_AVAILABLE:
+        return len(content), xxhash.xxh3_64_intdigest(content)
+    return len(content), hashlib.blake2b(content.encode('utf-8'), digest_size=8).digest()
+
+
 class SmartContentAnalyzer:
     """
     Advanced content analyzer that intelligently extracts all types of entities and information
     from scraped web content including people, companies, roles, timelines, skills, etc.
     """
     
+    # Number of distinct contents whose base analysis is kept
+    ANALYSIS_CACHE_SIZE = 256
+    # JSON-LD scripts at least this many characters long are not parsed
+    MAX_JSON_LD_LENGTH = 1_000_000
+    # Confidence of each kind of contact found by _extract_contact_info
+    CONTACT_CONFIDENCE = {'email': 0.95, 'phone': 0.9, 'website': 0.8}
+    
     def __init__(self):
         self.initialize_patterns()
+        self._analysis_cache = OrderedDict()
         
     def initialize_patterns(self):
         """Initialize all detection patterns and rules"""
@@ -34,14 +107,14 @@ class SmartContentAnalyzer:
         
         # COMPANY/ORGANIZATION PATTERNS
         self.company_patterns = {
-            'suffixes': {
+            'suffixes': frozenset({
                 'services', 'tech', 'technologies', 'management', 'plus', 'digital',
                 'corp', 'corporation', 'inc', 'incorporated', 'ltd', 'limited',
                 'llc', 'group', 'solutions', 'systems', 'company', 'co', 'enterprises',
                 'consulting', 'consultancy', 'agency', 'studio', 'labs', 'works',
                 'partners', 'associates', 'holdings', 'ventures', 'capital', 'media',
                 'communications', 'marketing', 'advertising', 'design', 'development'
-            },
+            }),
             'prefixes': {
                 'the', 'a', 'an'
             },
@@ -54,25 +127,25 @@ class SmartContentAnalyzer:
         
         # JOB TITLE/ROLE PATTERNS
         self.role_patterns = {
-            'executive': {
+            'executive': frozenset({
                 'ceo', 'chief executive officer', 'cto', 'chief technology officer',
                 'cfo', 'chief financial officer', 'coo', 'chief operating officer',
                 'president', 'vice president', 'vp', 'executive director'
-            },
-            'leadership': {
+            }),
+            'leadership': frozenset({
                 'founder', 'co-founder', 'director', 'managing director', 'head',
                 'lead', 'team lead', 'manager', 'senior manager', 'general manager',
                 'project manager', 'product manager', 'program manager'
-            },
-            'technical': {
+            }),
+            'technical': frozenset({
                 'developer', 'engineer', 'software engineer', 'senior developer',
                 'lead developer', 'architect', 'technical lead', 'tech lead',
                 'analyst', 'consultant', 'specialist', 'expert', 'advisor'
-            },
-            'business': {
+            }),
+            'business': frozenset({
                 'strategist', 'consultant', 'advisor', 'coordinator', 'supervisor',
                 'administrator', 'executive', 'officer', 'representative', 'agent'
-            }
+            })
         }
         
         # TIMELINE/DATE PATTERNS
@@ -97,26 +170,42 @@ class SmartContentAnalyzer:
         
         # SKILL/TECHNOLOGY PATTERNS
         self.skill_patterns = {
-            'programming': {
+            'programming': frozenset({
                 'python', 'javascript', 'java', 'c++', 'c#', 'php', 'ruby', 'go',
                 'swift', 'kotlin', 'typescript', 'scala', 'rust', 'html', 'css',
                 'sql', 'nosql', 'mongodb', 'mysql', 'postgresql', 'redis'
-            },
-            'frameworks': {
+            }),
+            'frameworks': frozenset({
                 'react', 'angular', 'vue', 'django', 'flask', 'spring', 'laravel',
                 'express', 'fastapi', 'bootstrap', 'tailwind', 'jquery', 'node.js'
-            },
-            'tools': {
+            }),
+            'tools': frozenset({
                 'git', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'jenkins',
                 'gitlab', 'github', 'jira', 'confluence', 'slack', 'teams'
-            },
-            'business_skills': {
+            }),
+            'business_skills': frozenset({
                 'management', 'leadership', 'strategy', 'planning', 'analysis',
                 'marketing', 'sales', 'consulting', 'project management',
                 'business development', 'operations', 'finance', 'accounting'
-            }
+            })
         }
         
+        # Every skill keyword in one alternation, so a single sweep over the content
+        # finds all of them. Longest first, and matched inside a lookahead at every word
+        # start so that skills inside a longer one are still seen. Only the longest skill
+        # is captured at each word, so shorter skills it starts with (e.g. 'react' for
+        # 'react native') are mapped to it here and added by _extract_skills.
+        all_skills = {skill.lower() for skill_set in self.skill_patterns.values() for skill in skill_set}
+        self._re_skills = re.compile(
+            r'(?<!\w)(?=(' + '|'.join(re.escape(skill) for skill in sorted(all_skills, key=len, reverse=True)) + r')(?!\w))'
+        )
+        self._skill_prefixes = {}
+        for skill in all_skills:
+            words = skill.split()
+            prefixes = [' '.join(words[:n]) for n in range(1, len(words)) if ' '.join(words[:n]) in all_skills]
+            if prefixes:
+                self._skill_prefixes[skill] = prefixes
+        
         # LOCATION PATTERNS
         self.location_patterns = {
             'indicators': ['located', 'based', 'headquarters', 'office', 'address'],
@@ -126,11 +215,200 @@ class SmartContentAnalyzer:
                 r'\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd)'
             ]
         }
+        
+        self._compile_patterns()
+
+    def _compile_patterns(self):
+        """Compile every extraction regex once, so analyze_content never compiles per call"""
+        
+        # People
+        self._re_person_titles = [
+            (title, re.compile(rf'\b{title}\.?\s++([A-Z][a-z]++(?:\s++[A-Z][a-z]++)*)\b', re.IGNORECASE))
+            for title in self.person_indicators['titles']
+        ]
+        # Each with a literal the content must contain for the pattern to match at all
+        self._re_professional_contexts = [(literal, re.compile(pattern, re.IGNORECASE)) for literal, pattern in [
+            ('founded by', r'founded by ([A-Z][a-z]++(?:\s++[A-Z][a-z]++)*)'),
+            ('created by', r'created by ([A-Z][a-z]++(?:\s++[A-Z][a-z]++)*)'),
+            ('developed by', r'developed by ([A-Z][a-z]++(?:\s++[A-Z][a-z]++)*)'),
+            (' is ', r'([A-Z][a-z]++(?:\s++[A-Z][a-z]++)*) is (?:a|an|the) (?:founder|director|manager|ceo)'),
+            (' founded', r'([A-Z][a-z]++(?:\s++[A-Z][a-z]++)*) founded'),
+            (' established', r'([A-Z][a-z]++(?:\s++[A-Z][a-z]++)*) established')
+        ]]
+        
+        # Companies
+        # Suffixes longest first, so the alternation order no longer depends on set iteration
+        suffixes = sorted(self.company_patterns['suffixes'], key=lambda suffix: (-len(suffix), suffix))
+        self._re_company_suffix = _compile_linear(
+            r'\b([A-Z][A-Za-z\s&]+?)\s+(' + '|'.join(re.escape(suffix) for suffix in suffixes) + r')\b', re.IGNORECASE
+        )
+        # Paired with a literal the lowercased content must contain (None: always run)
+        self._re_job_contexts = [(literal, _compile_linear(pattern, re.IGNORECASE)) for literal, pattern in [
+            (None, r'(?:co-founder|founder|director|manager|ceo|cto|head|lead)\s+(?:at|of|for)\s+([A-Z][A-Za-z\s&]+?)(?:[\s,.;]|$)'),
+            ('works ', r'works (?:at|for)\s+([A-Z][A-Za-z\s&]+?)(?:[\s,.;]|$)'),
+            ('employed ', r'employed (?:by|at)\s+([A-Z][A-Za-z\s&]+?)(?:[\s,.;]|$)'),
+            ('joined', r'joined\s+([A-Z][A-Za-z\s&]+?)(?:[\s,.;]|$)')
+        ]]
+        self._re_timeline_company = _compile_linear(
+            r'(\d{4})\s*[-–—]\s*(?:present|current|\d{4})\s+[^-\n]*?[-–—]\s*([A-Z][A-Za-z\s&]+?)(?:[\s,.;]|$)',
+            re.IGNORECASE
+        )
+        
+        # Roles: a single alternation over every role, longest first, matched inside a
+        # lookahead at each word start so roles nested in longer ones are found too
+        self._role_to_category = {}
+        for cat_name, cat_roles in self.role_patterns.items():
+            for role in cat_roles:
+                self._role_to_category.setdefault(role, cat_name)
+        self._all_roles_sorted = sorted(self._role_to_category, key=len, reverse=True)
+        self._re_roles = re.compile(
+            r'\b(?=(' + '|'.join(re.escape(role) for role in self._all_roles_sorted) + r')s?\b)'
+        )
+        self._role_prefixes = {
+            role: [other for other in self._all_roles_sorted if role.startswith(other + ' ')]
+            for role in self._all_roles_sorted
+        }
+        
+        # Timeline and statistics: every one of these patterns starts at a word boundary
+        # before a digit, '$' or a month name, so they are fused into a single scan. A month
+        # name only opens a candidate when a year follows it, so ordinary words such as
+        # 'market' or 'may' are rejected by the guard alone.
+        numeric_patterns = (
+            [('year_ranges', pattern) for pattern in self.timeline_patterns['year_ranges']] +
+            [('single_years', pattern) for pattern in self.timeline_patterns['single_years']] +
+            [('date_formats', pattern) for pattern in self.timeline_patterns['date_formats']] +
+            [('statistics', pattern) for pattern in [
+                r'\b\d+(?:,\d{3})*\+?\s*(?:users|clients|customers|employees|years|months)\b',
+                r'\b\$\d+(?:,\d{3})*(?:\.\d{2})?\s*(?:million|billion|thousand)?\b',
+                r'\b\d+%\s*(?:growth|increase|improvement|success)\b'
+            ]]
+        )
+        self._re_numeric = self._compile_fused(
+            numeric_patterns,
+            r'\b(?=[\d$]|(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\w*\s+(?:19|20)\d{2}\b)'
+        )
+        
+        # Skills
+        self._re_skill_phrases = [(phrase, _compile_linear(re.escape(phrase) + r' ([^,.]+)', re.IGNORECASE)) for phrase in [
+            'skilled in', 'expertise in', 'specializes in', 'experienced with', 'proficient in'
+        ]]
+        
+        # Locations
+        self._re_location_indicators = self._compile_indicators(
+            self.location_patterns['indicators'], r'\s+(?:in|at)?\s*([A-Z][A-Za-z\s,]+?)(?:[\s,.;]|$)'
+        )
+        self._re_location_formats = [re.compile(pattern) for pattern in self.location_patterns['formats']]
+        
+        # Projects and achievements
+        self._re_project_indicators = self._compile_indicators([
+            'project', 'developed', 'created', 'built', 'launched', 'implemented',
+            'designed', 'worked on', 'contributed to', 'led', 'managed'
+        ], r'\s++([A-Z][A-Za-z\s]+?)(?:[\s,.;]|$)')
+        self._re_achievement_indicators = self._compile_indicators([
+            'achieved', 'accomplished', 'awarded', 'recognized', 'honored',
+            'certified', 'graduated', 'completed', 'successful', 'winner'
+        ], r'\s+([^,.]+?)(?:[\s,.;]|$)')
+
+    def _compile_indicators(self, indicators: List[str], tail: str) -> Tuple[List[str], re.Pattern]:
+        """
+        Compile a list of indicator words that share the same tail pattern into one regex.
+        The match sits in a lookahead so it is tried at every position, for every indicator.
+        """
+        alternation = '|'.join(re.escape(indicator) for indicator in indicators)
+        return indicators, re.compile(rf'(?=(({alternation}){tail}))', re.IGNORECASE)
+
+    def _find_indicator_matches(self, compiled: Tuple[List[str], re.Pattern], content: str) -> Dict[str, List[str]]:
+        """
+        Scan content once for all indicators and return the tail matches per indicator,
+        in indicator order and non-overlapping per indicator, as a findall per indicator would
+        """
+        indicators, pattern = compiled
+        found = {indicator: [] for indicator in indicators}
+        next_start = dict.fromkeys(indicators, 0)
+        
+        for match in pattern.finditer(content):
+            indicator = match.group(2).lower()
+            if match.start() >= next_start[indicator]:
+                next_start[indicator] = match.start() + len(match.group(1))
+                found[indicator].append(match.group(3))
+        
+        return found
+
+    def _compile_fused(self, patterns: List[Tuple[str, str]], guard: str) -> Tuple[re.Pattern, List[Tuple[str, int, int]]]:
+        """
+        Fuse (name, pattern) pairs into one case-insensitive regex. Each pattern sits in its
+        own optional lookahead, so all of them are tried at every position the guard accepts.
+        """
+        parts = []
+        layout = []
+        group = 1
+        for name, pattern in patterns:
+            group_count = re.compile(pattern).groups
+            parts.append(f'(?:(?=({pattern})))?')
+            layout.append((name, group, group_count))
+            group += 1 + group_count
+        return re.compile(guard + ''.join(parts), re.IGNORECASE), layout
+
+    def _fused_findall(self, compiled: Tuple[re.Pattern, List[Tuple[str, int, int]]], content: str) -> Dict[str, List[list]]:
+        """
+        Scan content once with a fused regex. Returns, per name, one list per pattern holding
+        exactly what pattern.findall(content) would (matches of a pattern never overlap).
+        """
+        pattern, layout = compiled
+        found = [[] for _ in layout]
+        next_start = [0] * len(layout)
+        
+        for match in pattern.finditer(content):
+            # Most guard hits (a month-like word start, a stray digit) match no pattern
+            if match.lastindex is None:
+                continue
+            start = match.start()
+            groups = match.groups()
+            for i, (name, group, group_count) in enumerate(layout):
+                text = groups[group - 1]
+                if text is None or start < next_start[i]:
+                    continue
+                next_start[i] = start + len(text)
+                if group_count == 0:
+                    found[i].append(text)
+                elif group_count == 1:
+                    found[i].append(groups[group] or '')
+                else:
+                    found[i].append(tuple(g or '' for g in groups[group:group + group_count]))
+        
+        results = {}
+        for (name, _, _), matches in zip(layout, found):
+            results.setdefault(name, []).append(matches)
+        return results
 
     def analyze_content(self, content: str, question: str = "") -> Dict[str, Any]:
         """
         Comprehensive content analysis to extract all relevant entities and information
         """
+        # Pages are often re-fetched unchanged, so the question-independent analysis
+        # is cached by content hash and copied before anything can modify it
+        key = _content_key(content)
+        cached = self._analysis_cache.get(key)
+        if cached is None:
+            cached = self._analyze_core(content)
+            self._analysis_cache[key] = cached
+            if len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        else:
+            self._analysis_cache.move_to_end(key)
+        analysis_result = copy.deepcopy(cached)
+        
+        # If a specific question is provided, prioritize relevant entities
+        if question:
+            analysis_result = self._prioritize_for_question(analysis_result, question)
+        
+        return analysis_result
+
+    def _analyze_core(self, content: str) -> Dict[str, Any]:
+        """
+        Run every extractor over the content, independent of any question. Without the GIL,
+        extractors run concurrently on a shared thread pool, so they must not modify shared state.
+        """
         analysis_result = {
             'people': [],
             'companies': [],
@@ -146,76 +424,79 @@ class SmartContentAnalyzer:
             'confidence_score': 0.0
         }
         
-        # Analyze different types of entities
-        analysis_result['people'] = self._extract_people(content)
-        analysis_result['companies'] = self._extract_companies(content)
-        analysis_result['roles'] = self._extract_roles(content)
-        analysis_result['timeline'] = self._extract_timeline_info(content)
-        analysis_result['skills'] = self._extract_skills(content)
-        analysis_result['locations'] = self._extract_locations(content)
-        analysis_result['projects'] = self._extract_projects(content)
-        analysis_result['achievements'] = self._extract_achievements(content)
-        analysis_result['contact_info'] = self._extract_contact_info(content)
-        analysis_result['other_entities'] = self._extract_other_entities(content)
-        analysis_result['structured_data'] = self._extract_structured_data(content)
+        # Lowercased once for the extractors that match on lowercase text
+        content_lower = content.lower()
+        # Dates, years and statistics, found in one scan
+        numeric_matches = self._fused_findall(self._re_numeric, content)
+        
+        # Analyze different types of entities. The extractors only read their arguments and
+        # the compiled patterns, and must stay free of side effects, so they run side by side
+        extractors = {
+            'people': (self._extract_people, content, content_lower),
+            'companies': (self._extract_companies, content, content_lower),
+            'roles': (self._extract_roles, content_lower),
+            'timeline': (self._extract_timeline_info, numeric_matches),
+            'skills': (self._extract_skills, content, content_lower),
+            'locations': (self._extract_locations, content),
+            'projects': (self._extract_projects, content),
+            'achievements': (self._extract_achievements, content),
+            'contact_info': (self._extract_contact_info, content),
+            'other_entities': (self._extract_other_entities, numeric_matches),
+            'structured_data': (self._extract_structured_data, content)
+        }
+        if _EXTRACTOR_POOL is not None:
+            futures = {key: _EXTRACTOR_POOL.submit(*job) for key, job in extractors.items()}
+            for key, future in futures.items():
+                analysis_result[key] = future.result()
+        else:
+            for key, (extractor, *args) in extractors.items():
+                analysis_result[key] = extractor(*args)
         
         # Calculate overall confidence score
         analysis_result['confidence_score'] = self._calculate_confidence(analysis_result)
         
-        # If a specific question is provided, prioritize relevant entities
-        if question:
-            analysis_result = self._prioritize_for_question(analysis_result, question)
-        
         return analysis_result
 
-    def _extract_people(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_people(self, content: str, content_lower: str) -> List[Dict[str, Any]]:
         """Extract person names and related information"""
         people = []
+        # The name patterns are case-insensitive, so they can only be prefiltered on
+        # their literal words; patterns whose words are absent are not run at all
         
         # Pattern 1: Names with titles
-        for title in self.person_indicators['titles']:
-            pattern = rf'\b{title}\.?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
+        for title, pattern in self._re_person_titles:
+            if title not in content_lower:
+                continue
+            for match in pattern.finditer(content):
                 people.append({
-                    'name': match,
+                    'name': match.group(1),
                     'title': title,
                     'confidence': 0.9,
                     'context': f"Found with title: {title}"
                 })
         
         # Pattern 2: Proper names in professional context
-        professional_contexts = [
-            r'founded by ([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'created by ([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'developed by ([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*) is (?:a|an|the) (?:founder|director|manager|ceo)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*) founded',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*) established'
-        ]
-        
-        for pattern in professional_contexts:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                if len(match.split()) <= 3:  # Reasonable name length
+        for literal, pattern in self._re_professional_contexts:
+            if literal not in content_lower:
+                continue
+            for match in pattern.finditer(content):
+                name = match.group(1)
+                if len(name.split()) <= 3:  # Reasonable name length
                     people.append({
-                        'name': match,
+                        'name': name,
                         'confidence': 0.8,
                         'context': "Found in professional context"
                     })
         
         return self._deduplicate_entities(people, 'name')
 
-    def _extract_companies(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_companies(self, content: str, content_lower: str) -> List[Dict[str, Any]]:
         """Extract company/organization names"""
         companies = []
         
         # Pattern 1: Names with business suffixes
-        suffix_pattern = r'\b([A-Z][A-Za-z\s&]+?)\s+(' + '|'.join(self.company_patterns['suffixes']) + r')\b'
-        matches = re.findall(suffix_pattern, content, re.IGNORECASE)
-        
-        for match in matches:
-            company_base, suffix = match
+        for match in self._re_company_suffix.finditer(content):
+            company_base, suffix = match.groups()
             company_name = f"{company_base.strip()} {suffix.strip()}"
             companies.append({
                 'name': self._clean_entity_name(company_name),
@@ -225,17 +506,11 @@ class SmartContentAnalyzer:
             })
         
         # Pattern 2: Companies in job context
-        job_context_patterns = [
-            r'(?:co-founder|founder|director|manager|ceo|cto|head|lead)\s+(?:at|of|for)\s+([A-Z][A-Za-z\s&]+?)(?:\s|$|,|\.|;)',
-            r'works (?:at|for)\s+([A-Z][A-Za-z\s&]+?)(?:\s|$|,|\.|;)',
-            r'employed (?:by|at)\s+([A-Z][A-Za-z\s&]+?)(?:\s|$|,|\.|;)',
-            r'joined\s+([A-Z][A-Za-z\s&]+?)(?:\s|$|,|\.|;)'
-        ]
-        
-        for pattern in job_context_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                company_name = self._clean_entity_name(match)
+        for literal, pattern in self._re_job_contexts:
+            if literal is not None and literal not in content_lower:
+                continue
+            for match in pattern.finditer(content):
+                company_name = self._clean_entity_name(match.group(1))
                 if len(company_name) > 2:
                     companies.append({
                         'name': company_name,
@@ -245,11 +520,8 @@ class SmartContentAnalyzer:
                     })
         
         # Pattern 3: Timeline company extraction
-        timeline_pattern = r'(\d{4})\s*[-–—]\s*(?:present|current|\d{4})\s+[^-\n]*?[-–—]\s*([A-Z][A-Za-z\s&]+?)(?:\s|$|,|\.|;)'
-        matches = re.findall(timeline_pattern, content, re.IGNORECASE)
-        
-        for match in matches:
-            year, company_text = match
+        for match in self._re_timeline_company.finditer(content):
+            year, company_text = match.groups()
             company_name = self._clean_entity_name(company_text)
             if len(company_name) > 2:
                 companies.append({
@@ -261,48 +533,36 @@ class SmartContentAnalyzer:
         
         return self._deduplicate_entities(companies, 'name')
 
-    def _extract_roles(self, content: str) -> List[Dict[str, Any]]:
-        """Extract job titles and professional roles"""
+    def _extract_roles(self, content_lower: str) -> List[Dict[str, Any]]:
+        """Extract job titles and professional roles (from the lowercased content)"""
         roles = []
         
-        # Combine all role categories
-        all_roles = set()
-        for category in self.role_patterns.values():
-            all_roles.update(category)
-        
-        for role in all_roles:
-            # Look for the role in various contexts
-            patterns = [
-                rf'\b{re.escape(role)}\b',
-                rf'\b{re.escape(role)}s?\b',  # plural
-                rf'\b(?:senior|lead|junior|assistant)\s+{re.escape(role)}\b'
-            ]
-            
-            for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    # Determine role category
-                    category = 'general'
-                    for cat_name, cat_roles in self.role_patterns.items():
-                        if role in cat_roles:
-                            category = cat_name
-                            break
-                    
-                    roles.append({
-                        'title': role,
-                        'category': category,
-                        'confidence': 0.8,
-                        'context': f"Found as {category} role"
-                    })
+        # One sweep finds every role (and its plural); a matched role also implies
+        # the shorter roles it starts with, e.g. 'lead' for 'lead developer'
+        found_roles = {}
+        for match in self._re_roles.finditer(content_lower):
+            role = match.group(1)
+            found_roles[role] = None
+            for prefix_role in self._role_prefixes[role]:
+                found_roles[prefix_role] = None
+        
+        for role in found_roles:
+            category = self._role_to_category[role]
+            roles.append({
+                'title': role,
+                'category': category,
+                'confidence': 0.8,
+                'context': f"Found as {category} role"
+            })
         
         return self._deduplicate_entities(roles, 'title')
 
-    def _extract_timeline_info(self, content: str) -> List[Dict[str, Any]]:
-        """Extract timeline, dates, and experience information"""
+    def _extract_timeline_info(self, numeric_matches: Dict[str, List[list]]) -> List[Dict[str, Any]]:
+        """Extract timeline, dates, and experience information (from the fused numeric scan)"""
         timeline_info = []
         
         # Year ranges
-        for pattern in self.timeline_patterns['year_ranges']:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for matches in numeric_matches['year_ranges']:
             for match in matches:
                 start_year, end_period = match
                 timeline_info.append({
@@ -314,8 +574,7 @@ class SmartContentAnalyzer:
                 })
         
         # Single years
-        for pattern in self.timeline_patterns['single_years']:
-            matches = re.findall(pattern, content)
+        for matches in numeric_matches['single_years']:
             for match in matches:
                 timeline_info.append({
                     'type': 'single_year',
@@ -325,8 +584,7 @@ class SmartContentAnalyzer:
                 })
         
         # Date formats
-        for pattern in self.timeline_patterns['date_formats']:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for matches in numeric_matches['date_formats']:
             for match in matches:
                 if isinstance(match, tuple):
                     date_str = ' '.join(str(m) for m in match if m)
@@ -342,15 +600,17 @@ class SmartContentAnalyzer:
         
         return timeline_info
 
-    def _extract_skills(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_skills(self, content: str, content_lower: str) -> List[Dict[str, Any]]:
         """Extract skills, technologies, and expertise"""
         skills = []
-        content_lower = content.lower()
+        found_skills = set(self._re_skills.findall(content_lower))
+        for skill in [skill for skill in found_skills if skill in self._skill_prefixes]:
+            found_skills.update(self._skill_prefixes[skill])
         
         # Check all skill categories
         for category, skill_set in self.skill_patterns.items():
             for skill in skill_set:
-                if skill.lower() in content_lower:
+                if skill.lower() in found_skills:
                     skills.append({
                         'name': skill,
                         'category': category,
@@ -359,22 +619,16 @@ class SmartContentAnalyzer:
                     })
         
         # Look for skill-related phrases
-        skill_phrases = [
-            r'skilled in ([^,.]+)',
-            r'expertise in ([^,.]+)',
-            r'specializes in ([^,.]+)',
-            r'experienced with ([^,.]+)',
-            r'proficient in ([^,.]+)'
-        ]
-        
-        for pattern in skill_phrases:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
+        for phrase, pattern in self._re_skill_phrases:
+            if phrase not in content_lower:
+                continue
+            for match in pattern.finditer(content):
+                phrase = match.group(1)
                 skills.append({
-                    'name': match.strip(),
+                    'name': phrase.strip(),
                     'category': 'mentioned_skill',
                     'confidence': 0.8,
-                    'context': f"Explicitly mentioned skill: {match}"
+                    'context': f"Explicitly mentioned skill: {phrase}"
                 })
         
         return self._deduplicate_entities(skills, 'name')
@@ -384,9 +638,7 @@ class SmartContentAnalyzer:
         locations = []
         
         # Location indicators
-        for indicator in self.location_patterns['indicators']:
-            pattern = rf'{indicator}\s+(?:in|at)?\s*([A-Z][A-Za-z\s,]+?)(?:\s|$|,|\.|;)'
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for indicator, matches in self._find_indicator_matches(self._re_location_indicators, content).items():
             for match in matches:
                 locations.append({
                     'name': match.strip(),
@@ -396,11 +648,10 @@ class SmartContentAnalyzer:
                 })
         
         # Address formats
-        for pattern in self.location_patterns['formats']:
-            matches = re.findall(pattern, content)
-            for match in matches:
+        for pattern in self._re_location_formats:
+            for match in pattern.finditer(content):
                 locations.append({
-                    'name': match,
+                    'name': match.group(),
                     'type': 'formatted_address',
                     'confidence': 0.9,
                     'context': "Formatted address pattern"
@@ -412,14 +663,7 @@ class SmartContentAnalyzer:
         """Extract project and work information"""
         projects = []
         
-        project_indicators = [
-            'project', 'developed', 'created', 'built', 'launched', 'implemented',
-            'designed', 'worked on', 'contributed to', 'led', 'managed'
-        ]
-        
-        for indicator in project_indicators:
-            pattern = rf'{indicator}\s+([A-Z][A-Za-z\s]+?)(?:\s|$|,|\.|;)'
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for indicator, matches in self._find_indicator_matches(self._re_project_indicators, content).items():
             for match in matches:
                 if len(match.strip()) > 3:
                     projects.append({
@@ -435,14 +679,7 @@ class SmartContentAnalyzer:
         """Extract achievements and accomplishments"""
         achievements = []
         
-        achievement_indicators = [
-            'achieved', 'accomplished', 'awarded', 'recognized', 'honored',
-            'certified', 'graduated', 'completed', 'successful', 'winner'
-        ]
-        
-        for indicator in achievement_indicators:
-            pattern = rf'{indicator}\s+([^,.]+?)(?:\s|$|,|\.|;)'
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for indicator, matches in self._find_indicator_matches(self._re_achievement_indicators, content).items():
             for match in matches:
                 if len(match.strip()) > 5:
                     achievements.append({
@@ -458,51 +695,23 @@ class SmartContentAnalyzer:
         """Extract contact information"""
         contact_info = []
         
-        # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, content)
-        for email in emails:
+        # Emails, phones and websites in a single pass
+        for match in _CONTACT_RE.finditer(content):
+            contact_type = match.lastgroup
             contact_info.append({
-                'type': 'email',
-                'value': email,
-                'confidence': 0.95
-            })
-        
-        # Phone pattern
-        phone_pattern = r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, content)
-        for phone in phones:
-            contact_info.append({
-                'type': 'phone',
-                'value': phone,
-                'confidence': 0.9
-            })
-        
-        # Website pattern
-        website_pattern = r'https?://[^\s<>"\']+|www\.[^\s<>"\']+\.[a-z]{2,}'
-        websites = re.findall(website_pattern, content, re.IGNORECASE)
-        for website in websites:
-            contact_info.append({
-                'type': 'website',
-                'value': website,
-                'confidence': 0.8
+                'type': contact_type,
+                'value': match.group(contact_type),
+                'confidence': self.CONTACT_CONFIDENCE[contact_type]
             })
         
         return contact_info
 
-    def _extract_other_entities(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_other_entities(self, numeric_matches: Dict[str, List[list]]) -> List[Dict[str, Any]]:
         """Extract other relevant entities not covered by specific categories"""
         other_entities = []
         
         # Numbers and statistics
-        number_patterns = [
-            r'\b\d+(?:,\d{3})*\+?\s*(?:users|clients|customers|employees|years|months)\b',
-            r'\b\$\d+(?:,\d{3})*(?:\.\d{2})?\s*(?:million|billion|thousand)?\b',
-            r'\b\d+%\s*(?:growth|increase|improvement|success)\b'
-        ]
-        
-        for pattern in number_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for matches in numeric_matches['statistics']:
             for match in matches:
                 other_entities.append({
                     'type': 'statistic',
@@ -517,24 +726,35 @@ class SmartContentAnalyzer:
         """Extract structured data like JSON-LD, meta information"""
         structured_data = {}
         
-        # Look for JSON-LD data
-        json_pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-        json_matches = re.findall(json_pattern, content, re.DOTALL | re.IGNORECASE)
+        # Plain scraped text has no markup to parse
+        if not _STRUCTURED_TAG_RE.search(content):
+            return structured_data
         
-        for match in json_matches:
+        try:
+            root = etree.HTML(content)
+        except (etree.ParserError, ValueError) as e:
+            logger.debug(f"Could not parse content for structured data: {e}")
+            return structured_data
+        if root is None:
+            return structured_data
+        
+        # Look for JSON-LD data
+        for script in root.iter('script'):
+            if (script.get('type') or '').strip().lower() != 'application/ld+json' or not script.text:
+                continue
+            if len(script.text) >= self.MAX_JSON_LD_LENGTH:
+                continue
             try:
-                json_data = json.loads(match)
-                structured_data['json_ld'] = json_data
-            except:
+                structured_data['json_ld'] = orjson.loads(script.text)
+            except orjson.JSONDecodeError:
                 pass
         
-        # Look for meta tags
-        meta_pattern = r'<meta[^>]*name=["\']([^"\']+)["\'][^>]*content=["\']([^"\']+)["\'][^>]*>'
-        meta_matches = re.findall(meta_pattern, content, re.IGNORECASE)
-        
+        # Look for meta tags, in whatever attribute order they were written
         meta_data = {}
-        for name, content_val in meta_matches:
-            meta_data[name] = content_val
+        for meta in root.iter('meta'):
+            name, content_val = meta.get('name'), meta.get('content')
+            if name and content_val:
+                meta_data[name] = content_val
         
         if meta_data:
             structured_data['meta_tags'] = meta_data
@@ -550,10 +770,7 @@ class SmartContentAnalyzer:
         name = ' '.join(name.split())
         
         # Remove common prefixes/suffixes that aren't part of the name
-        prefixes_to_remove = ['the ', 'a ', 'an ']
-        for prefix in prefixes_to_remove:
-            if name.lower().startswith(prefix):
-                name = name[len(prefix):]
+        name = name[_NAME_PREFIXES_RE.match(name).end():]
         
         # Remove trailing punctuation
         name = name.rstrip('.,;:!?')
@@ -562,30 +779,30 @@ class SmartContentAnalyzer:
 
     def _deduplicate_entities(self, entities: List[Dict], key: str) -> List[Dict]:
         """Remove duplicate entities based on a key"""
-        seen = set()
-        unique_entities = []
+        # Dicts keep insertion order, so the first entity per key wins
+        unique_entities = {}
         
         for entity in entities:
-            entity_key = entity.get(key, '').lower().strip()
-            if entity_key and entity_key not in seen:
-                seen.add(entity_key)
-                unique_entities.append(entity)
-        
-        return unique_entities
+            entity_key = entity.get(key)
+            if not entity_key:
+                continue
+            entity_key = entity_key.strip().lower()
+            if entity_key and entity_key not in unique_entities:
+                unique_entities[entity_key] = entity
+        
+        return list(unique_entities.values())
 
     def _calculate_confidence(self, analysis_result: Dict[str, Any]) -> float:
         """Calculate overall confidence score for the analysis"""
-        total_entities = 0
-        total_confidence = 0.0
-        
-        for category, entities in analysis_result.items():
-            if isinstance(entities, list) and category != 'structured_data':
-                for entity in entities:
-                    if isinstance(entity, dict) and 'confidence' in entity:
-                        total_entities += 1
-                        total_confidence += entity['confidence']
+        # Every extractor returns a list of dicts that all carry a confidence
+        confidences = [
+            entity['confidence']
+            for category, entities in analysis_result.items()
+            if category != 'structured_data' and isinstance(entities, list)
+            for entity in entities
+        ]
         
-        return total_confidence / total_entities if total_entities > 0 else 0.0
+        return sum(confidences) / len(confidences) if confidences else 0.0
 
     def _prioritize_for_question(self, analysis_result: Dict[str, Any], question: str) -> Dict[str, Any]:
         """Prioritize extracted entities based on the specific question asked"""
@@ -7,6 +7,7 @@ Tests the improved chunking algorithm and company identification
 import os
 import sys
 import asyncio
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Add the current directory to Python path
@@ -18,14 +19,24 @@ from main import ChatRequest, chat_with_ai
 # Load environment variables
 load_dotenv()
 
+# How many AI questions may be in flight at once; tune per provider rate limits
+AI_CONCURRENCY = int(os.getenv('TEST_AI_CONCURRENCY', '4'))
+
+# MySQL URL for the test database, read from the environment once
+_DB_URL = f"mysql+pymysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
+
+@lru_cache(maxsize=1)
+def get_db_manager():
+    """DatabaseManager shared by every test, so they reuse one engine and connection pool"""
+    return DatabaseManager(_DB_URL)
+
 def test_company_chunking():
     """Test the enhanced company chunking algorithm"""
     print("🔍 TESTING ENHANCED COMPANY DETECTION ALGORITHM")
     print("=" * 60)
     
     # Initialize database manager
-    database_url = f"mysql+pymysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
-    db_manager = DatabaseManager(database_url)
+    db_manager = get_db_manager()
     
     # Test content with various company patterns
     test_content = """
@@ -60,9 +71,9 @@ def test_company_chunking():
     
     company_chunks = []
     for i, chunk in enumerate(chunks, 1):
-        print(f"{i:2d}. {chunk}")
-        if chunk.startswith(('Companies:', 'Company:')):
-            company_chunks.append(chunk)
+        print(f"{i:2d}. {chunk.text}")
+        if chunk.kind == 'company':
+            company_chunks.append(chunk.text)
         print()
     
     print("🏢 COMPANY-SPECIFIC CHUNKS DETECTED:")
@@ -75,11 +86,8 @@ def test_company_chunking():
     
     return chunks, company_chunks
 
-async def test_company_questions():
-    """Test various company-related questions"""
-    print("\n🤖 TESTING AI COMPANY QUESTION RESPONSES")
-    print("=" * 60)
-    
+async def ask_company_questions():
+    """Ask the company-related test questions, returning (question, response or exception) pairs in order"""
     # Test questions that should trigger company detection
     test_questions = [
         "list company names",
@@ -93,36 +101,53 @@ async def test_company_questions():
         "organizations he works with"
     ]
     
-    for question in test_questions:
+    # The questions are independent, so the AI round-trips overlap, bounded so the
+    # provider's rate limits do not turn into retries
+    requests = [
+        ChatRequest(
+            question=question,
+            user_id=1  # Use integer instead of string
+        )
+        for question in test_questions
+    ]
+    semaphore = asyncio.Semaphore(AI_CONCURRENCY)
+    
+    async def bounded_chat(request):
+        async with semaphore:
+            return await chat_with_ai(request)
+    
+    responses = await asyncio.gather(
+        *(bounded_chat(request) for request in requests), return_exceptions=True
+    )
+    return list(zip(test_questions, responses))
+
+def print_company_answers(answers):
+    """Print the AI responses to the company questions, in question order"""
+    print("\n🤖 TESTING AI COMPANY QUESTION RESPONSES")
+    print("=" * 60)
+    
+    for question, response in answers:
         print(f"\n❓ Question: '{question}'")
         print("-" * 30)
         
-        try:
-            # Create chat request
-            request = ChatRequest(
-                question=question,
-                user_id=1  # Use integer instead of string
-            )
-            
-            # Get AI response
-            response = await chat_with_ai(request)
-            
-            print(f"🎯 AI Response ({len(response.answer)} chars):")
-            print(f"   {response.answer}")
-            print(f"📊 Context Found: {response.context_found}")
-            print(f"⏱️  Response Time: {response.response_time_ms}ms")
-            
-        except Exception as e:
-            print(f"❌ Error: {str(e)}")
+        if isinstance(response, Exception):
+            print(f"❌ Error: {str(response)}")
+            continue
+        
+        print(f"🎯 AI Response ({len(response.answer)} chars):")
+        print(f"   {response.answer}")
+        print(f"📊 Context Found: {response.context_found}")
+        print(f"⏱️  Response Time: {response.response_time_ms}ms")
 
-def test_search_prioritization():
-    """Test search prioritization for company queries"""
-    print("\n🔍 TESTING SEARCH PRIORITIZATION FOR COMPANY QUERIES")
-    print("=" * 60)
-    
+async def test_company_questions():
+    """Test various company-related questions"""
+    # Nothing is printed until every answer is in, so the output stays in question order
+    print_company_answers(await ask_company_questions())
+
+def search_company_queries():
+    """Run the company-related search queries, returning (queries, results by query or exception)"""
     # Initialize database manager
-    database_url = f"mysql+pymysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
-    db_manager = DatabaseManager(database_url)
+    db_manager = get_db_manager()
     
     # Test company-related search queries
     test_queries = [
@@ -133,28 +158,43 @@ def test_search_prioritization():
         "organization"
     ]
     
+    # One batched call covers every query
+    try:
+        return test_queries, db_manager.search_content_batch(test_queries, limit=5)
+    except Exception as e:
+        return test_queries, e
+
+def print_search_results(test_queries, batch_results):
+    """Print the search results for each company query, in query order"""
+    print("\n🔍 TESTING SEARCH PRIORITIZATION FOR COMPANY QUERIES")
+    print("=" * 60)
+    
+    if isinstance(batch_results, Exception):
+        print(f"❌ Search Error: {str(batch_results)}")
+        return
+    
     for query in test_queries:
         print(f"\n🔎 Search Query: '{query}'")
         print("-" * 30)
         
-        try:
-            results = db_manager.search_content(query, limit=5)
+        results = batch_results.get(query, [])
+        
+        print(f"📊 Found {len(results)} results:")
+        for i, result in enumerate(results, 1):
+            chunks = result.get('matching_chunks', '')
+            score = result.get('relevance_score', 0)
+            search_type = result.get('search_type', 'unknown')
             
-            print(f"📊 Found {len(results)} results:")
-            for i, result in enumerate(results, 1):
-                chunks = result.get('matching_chunks', '')
-                score = result.get('relevance_score', 0)
-                search_type = result.get('search_type', 'unknown')
-                
-                print(f"{i}. Score: {score} | Type: {search_type}")
-                if chunks:
-                    # Show first chunk
-                    first_chunk = chunks.split(' | ')[0]
-                    print(f"   Chunk: {first_chunk[:100]}...")
-                print()
-                
-        except Exception as e:
-            print(f"❌ Search Error: {str(e)}")
+            print(f"{i}. Score: {score} | Type: {search_type}")
+            if chunks:
+                # Show first chunk
+                first_chunk = chunks.split(' | ')[0]
+                print(f"   Chunk: {first_chunk[:100]}...")
+            print()
+
+def test_search_prioritization():
+    """Test search prioritization for company queries"""
+    print_search_results(*search_company_queries())
 
 async def main():
     """Run all company detection tests"""
@@ -162,14 +202,22 @@ async def main():
     print("=" * 60)
     
     try:
+        # The database search and the AI questions exercise independent subsystems, so the
+        # search runs in a worker thread while the AI questions wait on the network. Both
+        # only return their results; everything is printed below, one test at a time
+        (test_queries, batch_results), answers = await asyncio.gather(
+            asyncio.to_thread(search_company_queries),
+            ask_company_questions()
+        )
+        
         # Test 1: Chunking algorithm
         chunks, company_chunks = test_company_chunking()
         
         # Test 2: Search prioritization
-        test_search_prioritization()
+        print_search_results(test_queries, batch_results)
         
         # Test 3: AI question responses
-        await test_company_questions()
+        print_company_answers(answers)
         
         print("\n✅ ALL TESTS COMPLETED!")
         print("=" * 60)
@@ -0,0 +1,41 @@
+"""
+Test script for the scraper's page extraction
+Checks that non-ASCII pages are decoded correctly, without any network access
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scraper import _extract_page_content
+
+# UTF-8 page with no <meta charset>, as served by many sites that only set the HTTP header
+_UTF8_PAGE = """<html><head><title>Café résumé</title></head>
+<body>
+    <h1>Café résumé</h1>
+    <p>Geschäftsführer der Übersicht GmbH seit 2019, verantwortlich für den Vertrieb.</p>
+    <a href="/team" title="Über uns">Über uns</a>
+</body></html>""".encode('utf-8')
+
+def test_non_ascii_without_meta_charset():
+    """Text read from the lxml tree must be decoded the same way as the soup's"""
+    print("🔍 Testing UTF-8 page without meta charset...")
+    page = _extract_page_content(_UTF8_PAGE, 'https://example.com/')
+    content = '\n'.join(page['content'])
+
+    print(f"Title: {page['title']}")
+    print(f"Headings: {page['headings']}")
+
+    assert page['title'] == 'Café résumé'
+    assert page['headings'] == ['H1: Café résumé']
+    assert 'Paragraph: Geschäftsführer der Übersicht GmbH' in content
+    assert 'Link Text: Über uns' in content
+    assert 'Link Title: Über uns' in content
+    assert 'Attribute title: Über uns' in content
+    assert 'Ã' not in content, "lxml tree decoded the page as latin-1"
+    print("✅ Non-ASCII text extracted correctly!")
+
+if __name__ == "__main__":
+    print("🚀 STARTING SCRAPER EXTRACTION TESTS")
+    test_non_ascii_without_meta_charset()
+    print("\n✅ ALL TESTS COMPLETED!")